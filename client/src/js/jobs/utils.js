@@ -172,11 +172,11 @@ const nuvsDescriptions = {
     },
     prepare_hmm: {
         title: "Prepare HMM Profiles",
-        description: "Run hmmpress on profiles in preparation for running hmmscan."
+        description: "Copy the vFam profiles in preparation for running hmmsearch."
     },
     vfam: {
         title: "VFam",
-        description: "Use hmmscan and vfam profiles to find viral motifs in the assembled contigs."
+        description: "Use hmmsearch and vfam profiles to find viral motifs in the assembled contigs."
     },
     import_results: importResultsDescription
 };
@@ -1,6 +1,7 @@
 import json
 
 import pytest
+from aiohttp.test_utils import make_mocked_coro
 
 import virtool.analyses.format
 
@@ -69,6 +70,121 @@ async def test_load_results(loadable, mocker, tmpdir):
     }
 
 
+async def test_format_pathoscope(mocker):
+    """
+    Test that hits are merged into their matching sequences, that isolates without hits are dropped, and that sequence
+    and OTU lengths are set.
 
+    """
+    patched_otus = {
+        "foo": {
+            "_id": "foo",
+            "name": "Foo",
+            "version": 3,
+            "abbreviation": "FOO",
+            "isolates": [
+                {
+                    "id": "hit_isolate",
+                    "sequences": [
+                        {
+                            "_id": "seq_1",
+                            "otu_id": "foo",
+                            "isolate_id": "hit_isolate",
+                            "accession": "AB1",
+                            "sequence": "ATGCATGC"
+                        },
+                        {
+                            "_id": "seq_2",
+                            "otu_id": "foo",
+                            "isolate_id": "hit_isolate",
+                            "accession": "AB2",
+                            "sequence": "ATG"
+                        }
+                    ]
+                },
+                {
+                    "id": "empty_isolate",
+                    "sequences": [
+                        {
+                            "_id": "seq_3",
+                            "otu_id": "foo",
+                            "isolate_id": "empty_isolate",
+                            "accession": "AB3",
+                            "sequence": "ATGCATGCATGC"
+                        }
+                    ]
+                }
+            ]
+        }
+    }
 
+    mocker.patch("virtool.analyses.format.gather_patched_otus", make_mocked_coro(patched_otus))
+    m_ensure = mocker.patch("virtool.analyses.format.ensure_pathoscope_coverage_cache", make_mocked_coro())
 
+    app = {
+        "db": "db",
+        "settings": {
+            "data_path": "/foo"
+        }
+    }
+
+    document = {
+        "_id": "bar",
+        "workflow": "pathoscope_bowtie",
+        "results": [
+            {
+                "id": "seq_1",
+                "otu": {
+                    "id": "foo",
+                    "version": 3
+                },
+                "pi": 0.5,
+                "reads": 12,
+                "coverage": 0.8,
+                "best": 0.4,
+                "align": [1, 2, 2, 1, 0, 0, 1, 1]
+            }
+        ]
+    }
+
+    formatted = await virtool.analyses.format.format_pathoscope(app, document)
+
+    m_ensure.assert_called_with("db", formatted)
+
+    assert formatted["results"] == [
+        {
+            "id": "foo",
+            "name": "Foo",
+            "version": 3,
+            "abbreviation": "FOO",
+            "length": 12,
+            "isolates": [
+                {
+                    "id": "hit_isolate",
+                    "sequences": [
+                        {
+                            "id": "seq_1",
+                            "accession": "AB1",
+                            "pi": 0.5,
+                            "reads": 12,
+                            "coverage": 0.8,
+                            "best": 0.4,
+                            "align": [1, 2, 2, 1, 0, 0, 1, 1],
+                            "length": 8
+                        },
+                        {
+                            "id": "seq_2",
+                            "otu_id": "foo",
+                            "isolate_id": "hit_isolate",
+                            "accession": "AB2",
+                            "pi": 0,
+                            "reads": 0,
+                            "coverage": 0,
+                            "best": 0,
+                            "length": 3
+                        }
+                    ]
+                }
+            ]
+        }
+    ]
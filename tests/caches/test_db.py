@@ -23,6 +23,22 @@ def test_calculate_cache_hash(trim_parameters):
     assert hashed == "68b60be51a667882d3aaa02a93259dd526e9c990"
 
 
+def test_calculate_cache_hashes(trim_parameters):
+    """
+    Test that batch hashing returns the same hashes as :func:`calculate_cache_hash` in the original order.
+
+    """
+    other = {**trim_parameters, "min_length": "30"}
+
+    hashes = virtool.caches.db.calculate_cache_hashes([trim_parameters, other, trim_parameters])
+
+    assert hashes == [
+        "68b60be51a667882d3aaa02a93259dd526e9c990",
+        virtool.caches.db.calculate_cache_hash(other),
+        "68b60be51a667882d3aaa02a93259dd526e9c990"
+    ]
+
+
 @pytest.mark.parametrize("paired", [True, False], ids=["paired", "unpaired"])
 def test_create(paired, snapshot, dbs, static_time, test_random_alphanumeric, trim_parameters):
     """
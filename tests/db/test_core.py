@@ -146,6 +146,30 @@ class TestCollection:
             {"_id": "baz", "tag": 1}
         ]
 
+    @pytest.mark.parametrize("attr_silent", [True, False])
+    @pytest.mark.parametrize("param_silent", [True, False])
+    async def test_update_many(self, attr_silent, param_silent, test_motor, create_test_collection):
+        collection = create_test_collection(silent=attr_silent)
 
+        await test_motor.samples.insert_many([
+            {"_id": "foo", "tag": 1},
+            {"_id": "bar", "tag": 2},
+            {"_id": "baz", "tag": 1}
+        ])
+
+        update_result = await collection.update_many({"tag": 1}, {"$set": {"tag": 3}}, silent=param_silent)
+
+        assert isinstance(update_result, pymongo.results.UpdateResult)
+        assert update_result.modified_count == 2
 
+        if attr_silent or param_silent:
+            assert collection.dispatch.called is False
+        else:
+            assert collection.dispatch.call_count == 2
+            collection.dispatch.assert_called_with("samples", "update", {"id": "foo", "mock": True})
 
+        assert await test_motor.samples.find().to_list(None) == [
+            {"_id": "foo", "tag": 3},
+            {"_id": "bar", "tag": 2},
+            {"_id": "baz", "tag": 3}
+        ]
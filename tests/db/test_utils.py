@@ -52,3 +52,32 @@ class TestApplyProjection:
             virtool.db.utils.apply_projection({}, "_id")
 
         assert "Invalid type for projection: <class 'str'>" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("duplicate", [False, True], ids=["unique", "duplicate"])
+async def test_insert_many_with_ids(duplicate, mocker, dbi):
+    """
+    Test that documents are inserted with generated ids and that documents with a generated id that already exists are
+    retried with a new id.
+
+    """
+    choices = ["baz", "bar", "foo"]
+
+    if duplicate:
+        choices.insert(0, "foo")
+        await dbi.sequences.insert_one({"_id": "foo"})
+
+    mocker.patch("virtool.utils.random_alphanumeric", side_effect=lambda length: choices.pop())
+
+    documents = [{"name": "a"}, {"name": "b"}, {"_id": "existing", "name": "c"}]
+
+    await virtool.db.utils.insert_many_with_ids(dbi.sequences, documents)
+
+    expected_ids = ["foo", "bar", "existing"]
+
+    if duplicate:
+        expected_ids = ["baz", "bar", "existing"]
+
+    assert [d["_id"] for d in documents] == expected_ids
+
+    assert await dbi.sequences.count_documents({"name": {"$exists": True}}) == 3
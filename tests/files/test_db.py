@@ -50,17 +50,12 @@ async def test_generate_id(exists, mocker, dbi):
     Test that a unique file id is returned even when the first attempt generates an already existing file id.
 
     """
-    m = mocker.Mock(side_effect=["foo", "bar"])
-
-    async def m_get_new_id(db):
-        return m(db)
-
     if exists:
         await dbi.files.insert_one({
             "_id": "foo-test.fq.gz"
         })
 
-    mocker.patch("virtool.db.utils.get_new_id", new=m_get_new_id)
+    mocker.patch("virtool.utils.random_alphanumeric", side_effect=["foo", "bar"])
 
     file_id = await virtool.files.db.generate_file_id(dbi, "test.fq.gz")
 
@@ -125,6 +120,31 @@ class TestCreate:
         assert document == expected.returned
         assert await dbi.files.find_one() == expected.inserted
 
+    async def test_duplicate(self, mocker, dbi, expected, static_time):
+        """
+        Test that a new file id is generated if the first one is taken before the document is inserted.
+
+        """
+        await dbi.files.insert_one({
+            "_id": "foo"
+        })
+
+        m = mocker.Mock(side_effect=["foo", "bar"])
+
+        async def m_generate_file_id(db, filename):
+            return m(db, filename)
+
+        mocker.patch("virtool.files.db.generate_file_id", new=m_generate_file_id)
+
+        document = await virtool.files.db.create(
+            dbi,
+            "test.fq.gz",
+            "reads"
+        )
+
+        assert document["id"] == "bar"
+        assert await dbi.files.find_one("bar") == dict(expected.inserted, _id="bar")
+
 
 @pytest.mark.parametrize("exists", [True, False])
 async def test_remove(exists, mocker, tmpdir, dbi):
@@ -1,6 +1,7 @@
 import datetime
 from aiohttp.test_utils import make_mocked_coro
 
+import pymongo.errors
 import pytest
 
 import virtool.history.db
@@ -95,6 +96,58 @@ class TestAdd:
         snapshot.assert_match(document)
 
 
+@pytest.mark.parametrize("too_large", [False, True])
+async def test_add_many(too_large, mocker, dbi, static_time, test_otu_edit):
+    """
+    Test that composed change documents are inserted in one batch and that the documents are inserted one at a time if
+    the batch contains a document that is too large.
+
+    """
+    app = {
+        "db": dbi,
+        "settings": {
+            "data_path": "/foo/bar"
+        }
+    }
+
+    old, new = test_otu_edit
+
+    documents = [
+        virtool.history.db.compose_document("create", None, old, "Created {}".format(old["name"]), "test"),
+        virtool.history.db.compose_document("edit", old, new, "Edited {}".format(new["name"]), "test")
+    ]
+
+    if too_large:
+        mocker.patch.object(dbi.history, "insert_many", side_effect=pymongo.errors.DocumentTooLarge())
+
+    await virtool.history.db.add_many(app, documents)
+
+    assert await dbi.history.find().sort("otu.version").to_list(None) == documents
+
+
+async def test_add_many_duplicate(dbi, static_time, test_otu_edit):
+    """
+    Test that changes that were already recorded are skipped without failing the rest of the batch.
+
+    """
+    app = {
+        "db": dbi,
+        "settings": {
+            "data_path": "/foo/bar"
+        }
+    }
+
+    old, new = test_otu_edit
+
+    create = virtool.history.db.compose_document("create", None, old, "Created {}".format(old["name"]), "test")
+    edit = virtool.history.db.compose_document("edit", old, new, "Edited {}".format(new["name"]), "test")
+
+    await virtool.history.db.add_many(app, [create])
+    await virtool.history.db.add_many(app, [create, edit])
+
+    assert await dbi.history.find().sort("otu.version").to_list(None) == [create, edit]
+
+
 @pytest.mark.parametrize("file", [True, False])
 async def test_get(file, mocker, snapshot, dbi):
     await dbi.history.insert_one({
@@ -1,3 +1,4 @@
+import datetime
 import json
 import os
 import sys
@@ -204,6 +205,20 @@ def test_json_object_hook(static_time):
     }
 
 
+def test_json_object_hook_fallback():
+    """
+    Test that `created_at` values the fixed-format parser can't handle are still decoded.
+
+    """
+    result = virtool.history.utils.json_object_hook({
+        "created_at": "2015-10-06T20:00:00Z"
+    })
+
+    assert result == {
+        "created_at": datetime.datetime(2015, 10, 6, 20)
+    }
+
+
 async def test_read_diff_file(mocker, snapshot):
     """
     Test that a diff is parsed to a `dict` correctly. ISO format dates must be converted to `datetime` objects.
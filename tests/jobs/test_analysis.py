@@ -62,3 +62,48 @@ def mock_job(tmpdir, mocker, request, dbs, test_db_connection_string, test_db_na
     job.init_db()
 
     return job
+
+
+def test_get_sequence_otu_map(mocker, dbs):
+    """
+    Test that sequences of OTUs still at their manifest version are mapped without patching and that only OTUs with
+    newer versions are patched.
+
+    """
+    dbs.otus.insert_many([
+        {"_id": "foo", "version": 2, "isolates": [{"id": "a"}]},
+        {"_id": "bar", "version": 3, "isolates": [{"id": "b"}]}
+    ])
+
+    dbs.sequences.insert_many([
+        {"_id": "s1", "otu_id": "foo", "isolate_id": "a"},
+        {"_id": "s2", "otu_id": "foo", "isolate_id": "a"},
+        {"_id": "s3", "otu_id": "foo", "isolate_id": "orphan"},
+        {"_id": "s4", "otu_id": "bar", "isolate_id": "b"}
+    ])
+
+    patched = {
+        "_id": "bar",
+        "isolates": [
+            {"id": "b", "sequences": [{"_id": "s5"}]}
+        ]
+    }
+
+    m_patch_otu_to_version = mocker.patch(
+        "virtool.db.sync.patch_otu_to_version",
+        return_value=(None, patched, None)
+    )
+
+    settings = {
+        "data_path": "/foo"
+    }
+
+    sequence_otu_map = virtool.jobs.analysis.get_sequence_otu_map(dbs, settings, {"foo": 2, "bar": 2})
+
+    assert sequence_otu_map == {
+        "s1": "foo",
+        "s2": "foo",
+        "s5": "bar"
+    }
+
+    m_patch_otu_to_version.assert_called_once_with(dbs, settings, "bar", 2)
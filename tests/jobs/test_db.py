@@ -9,6 +9,30 @@ status = {
 }
 
 
+async def test_cancel(dbi, static_time):
+    await dbi.jobs.insert_one({
+        "_id": "foo",
+        "status": [
+            dict(status, stage=None, state="waiting", progress=0),
+            dict(status, stage="mk_analysis_dir")
+        ]
+    })
+
+    await virtool.jobs.db.cancel(dbi, "foo")
+
+    document = await dbi.jobs.find_one("foo")
+
+    assert document["status"][-1] == {
+        "state": "cancelled",
+        "stage": "mk_analysis_dir",
+        "error": None,
+        "progress": 0.5,
+        "timestamp": static_time.datetime
+    }
+
+    assert len(document["status"]) == 3
+
+
 async def test_processor(dbi, static_time, test_job):
     """
     Test that the dispatch processor properly formats a raw job document into a dispatchable format.
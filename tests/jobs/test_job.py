@@ -0,0 +1,22 @@
+import io
+import queue
+
+import virtool.jobs.job
+
+
+def test_watch_pipe_chunks():
+    lines = [f"line {i}\n".encode() for i in range(100)]
+
+    stream = io.BytesIO(b"".join(lines))
+
+    q = queue.Queue()
+
+    virtool.jobs.job.watch_pipe_chunks(stream, q, hint=64)
+
+    chunks = list()
+
+    while not q.empty():
+        chunks.append(q.get())
+
+    assert len(chunks) > 1
+    assert [line for chunk in chunks for line in chunk] == lines
@@ -0,0 +1,102 @@
+import asyncio
+import multiprocessing
+import queue
+
+import pytest
+
+import virtool.jobs.manager
+
+
+class FakeJob(multiprocessing.Process):
+
+    def __init__(self, db_connection_string, db_name, settings, job_id, q):
+        super().__init__()
+
+
+@pytest.fixture
+def manager(mocker):
+    app = {
+        "db": mocker.Mock(),
+        "dispatcher": mocker.Mock(),
+        "process_executor": None,
+        "settings": {
+            "db_connection_string": "mongodb://localhost:27017",
+            "db_name": "virtool",
+            "proc": 2,
+            "mem": 8
+        }
+    }
+
+    return virtool.jobs.manager.IntegratedManager(app, mocker.Mock())
+
+
+def test_drain_queue():
+    """
+    Test that every waiting message is returned in order and that an empty queue returns an empty list.
+
+    """
+    q = queue.Queue()
+
+    messages = [
+        ("jobs", "update", ["foo"]),
+        ("jobs", "update", ["bar"]),
+        ("samples", "update", ["baz"])
+    ]
+
+    for message in messages:
+        q.put(message)
+
+    assert virtool.jobs.manager.drain_queue(q) == messages
+    assert virtool.jobs.manager.drain_queue(q) == []
+
+
+def test_coalesce_messages():
+    """
+    Test that consecutive messages with the same interface and operation are merged without duplicate ids and that
+    the order of operations is preserved.
+
+    """
+    messages = [
+        ("jobs", "update", ["foo"]),
+        ("jobs", "update", ["bar", "foo"]),
+        ("samples", "update", ["baz"]),
+        ("samples", "delete", ["baz"]),
+        ("jobs", "update", ["foo"])
+    ]
+
+    assert virtool.jobs.manager.coalesce_messages(messages) == [
+        ("jobs", "update", ["foo", "bar"]),
+        ("samples", "update", ["baz"]),
+        ("samples", "delete", ["baz"]),
+        ("jobs", "update", ["foo"])
+    ]
+
+
+async def test_start_waiting_and_handle_exit(manager):
+    """
+    Test that waiting jobs are started in order while resources are available and that the next waiting job is started
+    as soon as a running job exits.
+
+    """
+    for job_id in ["foo", "bar", "baz"]:
+        manager._jobs[job_id] = manager._waiting[job_id] = {
+            "process": None,
+            "class": FakeJob,
+            "task_name": "create_sample",
+            "task_args": {},
+            "proc": 1,
+            "mem": 2
+        }
+
+    manager.start_waiting()
+
+    assert list(manager._running) == ["foo", "bar"]
+    assert list(manager._waiting) == ["baz"]
+
+    for _ in range(100):
+        if not manager._jobs:
+            break
+
+        await asyncio.sleep(0.05)
+
+    assert manager._jobs == manager._waiting == manager._running == {}
@@ -216,7 +216,7 @@ def test_process_fasta(mock_job):
     )
 
 
-def test_press_hmm(mock_job):
+def test_prepare_hmm(mock_job):
     os.mkdir(mock_job.params["analysis_path"])
 
     hmm_path = os.path.join(mock_job.settings["data_path"], "hmm")
@@ -232,8 +232,8 @@ def test_press_hmm(mock_job):
 
     listing = os.listdir(mock_job.params["analysis_path"])
 
-    # Check that all the pressed file were written to the analysis directory.
-    assert all("profiles.hmm." + suffix in listing for suffix in ["h3p", "h3m", "h3f", "h3i"])
+    # Check that the profiles were copied to the analysis directory.
+    assert "profiles.hmm" in listing
 
 
 def test_vfam(mock_job, dbs):
@@ -267,11 +267,10 @@ def test_vfam(mock_job, dbs):
             "NGIPCIILVNEDEDWLQQMQPSQADWFNANAVVHYMYSGESFFEAL"
         )
 
-    for suffix in ["h3p", "h3m", "h3f", "h3i"]:
-        shutil.copyfile(
-            os.path.join(NUVS_PATH, "test.hmm." + suffix),
-            os.path.join(mock_job.params["analysis_path"], "profiles.hmm." + suffix)
-        )
+    shutil.copyfile(
+        os.path.join(NUVS_PATH, "test.hmm"),
+        os.path.join(mock_job.params["analysis_path"], "profiles.hmm")
+    )
 
     mock_job.results = [
         {
@@ -4,6 +4,7 @@ from aiohttp.test_utils import make_mocked_coro
 
 import pytest
 
+import virtool.otus.db
 import virtool.references.db
 import virtool.errors
 
@@ -338,3 +339,280 @@ async def test_delete_group_or_user(field, dbi):
         "groups": [subdocuments[1]] if field == "groups" else subdocuments,
         "users": [subdocuments[1]] if field == "users" else subdocuments
     }
+
+
+@pytest.mark.parametrize("remote", [True, False])
+async def test_insert_joined_otus(remote, mocker, dbi, static_time):
+    """
+    Test that OTUs are inserted in chunks, that sequences are linked to their inserted OTUs, and that the progress
+    handler is called once per chunk.
+
+    """
+    mocker.patch("virtool.references.db.OTU_INSERT_CHUNK_SIZE", 2)
+
+    otus = [
+        {
+            "_id": f"remote_{i}",
+            "name": f"Virus {i}",
+            "abbreviation": "",
+            "isolates": [
+                {
+                    "id": "isolate",
+                    "default": True,
+                    "source_name": "A",
+                    "source_type": "isolate",
+                    "sequences": [
+                        {
+                            "_id": f"remote_seq_{i}",
+                            "accession": f"AB{i}",
+                            "definition": "A sequence",
+                            "host": "",
+                            "sequence": "ATGC"
+                        }
+                    ]
+                }
+            ]
+        } for i in range(3)
+    ]
+
+    progress_handler = make_mocked_coro()
+
+    joined_otus = await virtool.references.db.insert_joined_otus(
+        dbi,
+        otus,
+        static_time.datetime,
+        "foo",
+        "bob",
+        remote=remote,
+        progress_handler=progress_handler
+    )
+
+    assert len(joined_otus) == 3
+    assert progress_handler.call_count == 2
+
+    otu_ids = [otu["_id"] for otu in joined_otus]
+
+    for joined in joined_otus:
+        assert joined == await virtool.otus.db.join(dbi, joined["_id"])
+
+    async for document in dbi.otus.find():
+        assert document["_id"] in otu_ids
+        assert document["reference"] == {"id": "foo"}
+        assert ("remote" in document) is remote
+
+        sequence = await dbi.sequences.find_one({"otu_id": document["_id"]})
+
+        assert sequence["reference"] == {"id": "foo"}
+        assert sequence["remote"]["id"] == "remote_seq_" + document["name"][-1]
+
+
+async def test_patch_many_to_versions(mocker):
+    """
+    Test that OTUs are patched to the requested versions and returned in the same order as the specifiers.
+
+    """
+    async def patch_to_version(app, otu_id, version):
+        return None, {"_id": otu_id, "version": version}, None
+
+    m_patch_to_version = mocker.patch("virtool.history.db.patch_to_version", side_effect=patch_to_version)
+
+    app = {"db": None}
+
+    patched = await virtool.references.db.patch_many_to_versions(app, [("foo", 2), ("bar", 0), ("baz", 5)])
+
+    assert patched == [
+        {"_id": "foo", "version": 2},
+        {"_id": "bar", "version": 0},
+        {"_id": "baz", "version": 5}
+    ]
+
+    assert m_patch_to_version.call_count == 3
+
+
+@pytest.mark.parametrize("stale", [False, True])
+async def test_fetch_and_update_release_not_modified(stale, mocker, dbi, static_time):
+    """
+    Test that the reference is not written when GitHub reports no new release and the stored retrieval time is recent,
+    and that it is written when the stored retrieval time is stale.
+
+    """
+    retrieved_at = static_time.datetime - virtool.references.db.RETRIEVED_AT_UPDATE_INTERVAL
+
+    if not stale:
+        retrieved_at = static_time.datetime
+
+    release = {
+        "name": "v1.1.0",
+        "etag": "foobar",
+        "newer": True,
+        "retrieved_at": retrieved_at
+    }
+
+    await dbi.references.insert_one({
+        "_id": "foo",
+        "errors": [],
+        "installed": {"name": "v1.0.0"},
+        "release": release,
+        "remotes_from": {"slug": "virtool/ref-plant-viruses"}
+    })
+
+    mocker.patch("virtool.github.get_release", make_mocked_coro(None))
+    m_update_one = mocker.spy(dbi.references, "update_one")
+
+    app = {
+        "db": dbi,
+        "client": None,
+        "settings": {}
+    }
+
+    result = await virtool.references.db.fetch_and_update_release(app, "foo")
+
+    assert result == {**release, "retrieved_at": static_time.datetime}
+    assert m_update_one.called is stale
+
+
+async def test_upsert_remote_sequences(mocker, dbi):
+    """
+    Test that existing sequences are updated by remote id and that new sequences are inserted with generated ids.
+
+    """
+    await dbi.sequences.insert_one({
+        "_id": "existing",
+        "reference": {"id": "foo"},
+        "remote": {"id": "remote_a"},
+        "sequence": "ATGC"
+    })
+
+    mocker.patch("virtool.utils.random_alphanumeric", return_value="generated")
+
+    await virtool.references.db.upsert_remote_sequences(dbi, "foo", [
+        {"reference": {"id": "foo"}, "remote": {"id": "remote_a"}, "sequence": "GGGG"},
+        {"reference": {"id": "foo"}, "remote": {"id": "remote_b"}, "sequence": "CCCC"}
+    ])
+
+    assert await dbi.sequences.find({}, ["sequence"]).sort("_id").to_list(None) == [
+        {"_id": "existing", "sequence": "GGGG"},
+        {"_id": "generated", "sequence": "CCCC"}
+    ]
+
+
+@pytest.mark.parametrize("empty", [False, True])
+async def test_get_contributors_and_unbuilt_count(empty, dbi):
+    """
+    Test that contributors and the unbuilt change count are calculated together and that a reference without history
+    has no contributors and no unbuilt changes.
+
+    """
+    if not empty:
+        await dbi.history.insert_many([
+            {"_id": "a.0", "reference": {"id": "foo"}, "index": {"id": "unbuilt"}, "user": {"id": "bob"}},
+            {"_id": "a.1", "reference": {"id": "foo"}, "index": {"id": "abc"}, "user": {"id": "bob"}},
+            {"_id": "b.0", "reference": {"id": "foo"}, "index": {"id": "unbuilt"}, "user": {"id": "fred"}},
+            {"_id": "c.0", "reference": {"id": "bar"}, "index": {"id": "unbuilt"}, "user": {"id": "fred"}}
+        ])
+
+    contributors, unbuilt_count = await virtool.references.db.get_contributors_and_unbuilt_count(dbi, "foo")
+
+    if empty:
+        assert contributors == []
+        assert unbuilt_count == 0
+        return
+
+    assert sorted(contributors, key=lambda c: c["id"]) == [
+        {"id": "bob", "count": 2},
+        {"id": "fred", "count": 1}
+    ]
+
+    assert unbuilt_count == 2
+
+
+async def test_fetch_and_update_release_targeted_set(mocker, dbi, static_time):
+    """
+    Test that updating the release only sets the `errors` and `release` fields and never sends the `updates` array.
+
+    """
+    await dbi.references.insert_one({
+        "_id": "foo",
+        "errors": [],
+        "installed": {"name": "v1.0.0"},
+        "release": None,
+        "remotes_from": {"slug": "virtool/ref-plant-viruses"},
+        "updates": [{"id": 1, "name": "v1.0.0", "ready": True}]
+    })
+
+    mocker.patch("virtool.github.get_release", make_mocked_coro({
+        "id": 2,
+        "name": "v1.1.0",
+        "body": "body",
+        "etag": "foobar",
+        "html_url": "https://www.example.com/release",
+        "published_at": "2019-07-23T21:10:17Z",
+        "assets": [{
+            "name": "reference.json.gz",
+            "size": 1024,
+            "browser_download_url": "https://www.example.com/file",
+            "content_type": "application/gzip"
+        }]
+    }))
+
+    m_update_one = mocker.spy(dbi.references, "update_one")
+
+    app = {
+        "db": dbi,
+        "client": None,
+        "settings": {}
+    }
+
+    release = await virtool.references.db.fetch_and_update_release(app, "foo")
+
+    assert release["newer"] is True
+
+    (query, update), _ = m_update_one.call_args
+
+    assert query == {"_id": "foo"}
+    assert list(update) == ["$set"]
+    assert set(update["$set"]) == {"errors", "release"}
+
+    assert (await dbi.references.find_one("foo"))["updates"] == [{"id": 1, "name": "v1.0.0", "ready": True}]
+
+
+async def test_insert_changes(mocker):
+    """
+    Test that change documents are composed with any passed joined OTUs and inserted with one `add_many` call per chunk.
+
+    """
+    mocker.patch("virtool.references.db.HISTORY_INSERT_CHUNK_SIZE", 2)
+
+    async def prepare_change(db, otu_id, verb, user_id, old=None, joined=None):
+        return {"_id": f"{otu_id}.0", "verb": verb, "joined": joined}
+
+    mocker.patch("virtool.references.db.prepare_change", prepare_change)
+
+    m_add_many = mocker.patch("virtool.history.db.add_many", make_mocked_coro())
+
+    app = {
+        "db": "db"
+    }
+
+    progress_handler = make_mocked_coro()
+
+    await virtool.references.db.insert_changes(
+        app,
+        ["foo", "bar", "baz"],
+        "import",
+        "bob",
+        joined_otus={"foo": {"_id": "foo"}},
+        progress_handler=progress_handler
+    )
+
+    assert [call[0][1] for call in m_add_many.call_args_list] == [
+        [
+            {"_id": "foo.0", "verb": "import", "joined": {"_id": "foo"}},
+            {"_id": "bar.0", "verb": "import", "joined": None}
+        ],
+        [
+            {"_id": "baz.0", "verb": "import", "joined": None}
+        ]
+    ]
+
+    assert [call[0][0] for call in progress_handler.call_args_list] == [2, 1]
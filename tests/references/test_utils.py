@@ -270,3 +270,20 @@ def test_get_sequence_schema(require_id):
             "required": True
         }
     }
+
+
+@pytest.mark.parametrize("name,other,newer", [
+    ("v1.2.3", "v1.2.2", True),
+    ("v1.2.3", "v1.2.3", False),
+    ("1.10.0", "v1.9.0", True),
+    ("v2.0.0-beta.1", "v2.0.0", False)
+])
+def test_parse_release_version(name, other, newer):
+    """
+    Test that parsed release versions compare the same way as :func:`semver.compare`.
+
+    """
+    parsed = virtool.references.utils.parse_release_version(name)
+    parsed_other = virtool.references.utils.parse_release_version(other)
+
+    assert (parsed > parsed_other) is newer
@@ -33,6 +33,11 @@ snapshots['test_schema 1'] = {
         'default': 'localhost',
         'type': 'string'
     },
+    'io_threads': {
+        'coerce': GenericRepr("<class 'int'>"),
+        'default': 0,
+        'type': 'integer'
+    },
     'lg_mem': {
         'coerce': GenericRepr("<class 'int'>"),
         'default': 8,
@@ -27,16 +27,24 @@ async def app(loop):
         pass
 
 
-async def test_init_executors(loop):
+@pytest.mark.parametrize("io_threads", [0, 12])
+async def test_init_executors(io_threads, loop):
     """
     Test that an instance of :class:`.ThreadPoolExecutor` is added to ``app`` state and that it works.
     """
     app = aiohttp.web.Application()
 
+    app["settings"] = {
+        "io_threads": io_threads
+    }
+
     await virtool.app.init_executors(app)
 
     assert isinstance(app["executor"], concurrent.futures.ThreadPoolExecutor)
 
+    if io_threads:
+        assert app["executor"]._max_workers == io_threads
+
     def func(*args):
         return sum(args)
 
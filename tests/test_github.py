@@ -1,4 +1,6 @@
 import pytest
+from aiohttp.test_utils import make_mocked_coro
+
 import virtool.github
 
 
@@ -44,6 +46,27 @@ def test_format_release(fake_release):
     assert result == fake_release.formatted
 
 
+def test_create_update_subdocument(static_time, fake_release):
+    release = dict(fake_release.formatted, retrieved_at=static_time.datetime)
+
+    result = virtool.github.create_update_subdocument(release, True, "bob")
+
+    assert result == {
+        "id": 0,
+        "body": "body",
+        "filename": "virtool.tar.gz",
+        "html_url": "https://www.example.com/release",
+        "name": "v3.2.1",
+        "published_at": "2019-07-23T21:10:17Z",
+        "size": 32203112,
+        "created_at": static_time.datetime,
+        "ready": True,
+        "user": {
+            "id": "bob"
+        }
+    }
+
+
 @pytest.mark.parametrize("release", [None, {"etag": "foobar"}, {"hello": "world"}])
 def test_get_etag(release):
     result = virtool.github.get_etag(release)
@@ -53,3 +76,38 @@ def test_get_etag(release):
         return
 
     assert result is None
+
+
+@pytest.mark.parametrize("cached", [True, False])
+async def test_get_release_cache(cached, mocker, fake_release):
+    """
+    Test that a `200` response with a previously seen ETag is served from the release cache without parsing the body.
+
+    """
+    mocker.patch.object(virtool.github, "RELEASE_CACHE", virtool.github.collections.OrderedDict())
+
+    if cached:
+        virtool.github.RELEASE_CACHE[("virtool/ref-plant-viruses", "latest", "etag")] = fake_release.raw
+
+    resp = mocker.Mock(status=200, headers={"etag": "etag"})
+    resp.json = make_mocked_coro({key: value for key, value in fake_release.raw.items() if key != "etag"})
+    resp.release = make_mocked_coro()
+
+    class MockProxyRequest:
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def __aenter__(self):
+            return resp
+
+        async def __aexit__(self, *args):
+            pass
+
+    mocker.patch("virtool.http.proxy.ProxyRequest", MockProxyRequest)
+
+    release = await virtool.github.get_release({}, mocker.Mock(), "virtool/ref-plant-viruses")
+
+    assert release == fake_release.raw
+    assert resp.json.called is not cached
+    assert resp.release.called is cached
@@ -5,6 +5,8 @@ import shutil
 import pickle
 import filecmp
 
+import numpy as np
+
 import virtool.pathoscope
 
 BASE_PATH = os.path.join(sys.path[0], "tests", "test_files", "pathoscope")
@@ -124,7 +126,27 @@ def test_calculate_coverage(tmpdir, test_sam_path):
 
                 ref_lengths[ref_id] = length
 
-    virtool.pathoscope.calculate_coverage(vta_path, ref_lengths)
+    coverage = virtool.pathoscope.calculate_coverage(vta_path, ref_lengths)
+
+    # Build the expected coverage by incrementing every aligned position, skipping positions past the reference end.
+    expected = dict()
+
+    with open(vta_path, "r") as handle:
+        for line in handle:
+            _, ref_id, pos, length, _ = line.split(",")
+
+            ref_coverage = expected.setdefault(ref_id, [0] * ref_lengths[ref_id])
+
+            for i in range(int(pos) - 1, min(int(pos) - 1 + int(length), ref_lengths[ref_id])):
+                ref_coverage[i] += 1
+
+    assert set(coverage) == set(expected)
+
+    for ref_id, ref_coverage in coverage.items():
+        assert isinstance(ref_coverage, np.ndarray)
+        assert np.issubdtype(ref_coverage.dtype, np.integer)
+        assert len(ref_coverage) == ref_lengths[ref_id]
+        assert ref_coverage.tolist() == expected[ref_id]
 
 
 def test_write_report(tmpdir):
@@ -1,9 +1,14 @@
 import os
 
+import pytest
+
 import virtool.subtractions.utils
 
 
-async def test_calculate_gc(tmpdir):
+@pytest.mark.parametrize("buffer_size", [16, 1024 * 1024], ids=["flushed", "single"])
+async def test_calculate_gc(buffer_size, mocker, tmpdir):
+    mocker.patch("virtool.subtractions.utils.GC_BUFFER_SIZE", buffer_size)
+
     lines = [
         ">foo\n",
         "ATGGACTGGTTCTCTCTCTCTAGGCACTG\n",
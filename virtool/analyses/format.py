@@ -151,46 +151,51 @@ async def format_pathoscope(app, document):
 
     formatted = dict()
 
+    # Sequences of each formatted OTU keyed by sequence id so hits can be matched without scanning every isolate.
+    sequences = dict()
+
     for hit in document["results"]:
 
         otu_id = hit["otu"]["id"]
 
-        otu_document = patched_otus[otu_id]
+        if otu_id not in formatted:
+            otu_document = patched_otus[otu_id]
 
-        max_ref_length = 0
+            max_ref_length = 0
 
-        for isolate in otu_document["isolates"]:
-            max_ref_length = max(max_ref_length, max([len(s["sequence"]) for s in isolate["sequences"]]))
+            for isolate in otu_document["isolates"]:
+                max_ref_length = max(max_ref_length, max([len(s["sequence"]) for s in isolate["sequences"]]))
 
-        otu = {
-            "id": otu_id,
-            "name": otu_document["name"],
-            "version": otu_document["version"],
-            "abbreviation": otu_document["abbreviation"],
-            "isolates": otu_document["isolates"],
-            "length": max_ref_length
-        }
+            formatted[otu_id] = {
+                "id": otu_id,
+                "name": otu_document["name"],
+                "version": otu_document["version"],
+                "abbreviation": otu_document["abbreviation"],
+                "isolates": otu_document["isolates"],
+                "length": max_ref_length
+            }
 
-        formatted[otu_id] = otu
+            sequences[otu_id] = {s["_id"]: s for isolate in otu_document["isolates"] for s in isolate["sequences"]}
 
-        for isolate in otu["isolates"]:
-            for sequence in isolate["sequences"]:
-                if sequence["_id"] == hit["id"]:
-                    sequence.update(hit)
-                    sequence["length"] = len(sequence["sequence"])
+        sequence = sequences[otu_id].get(hit["id"])
+
+        if sequence:
+            sequence.update(hit)
+            sequence["length"] = len(sequence["sequence"])
 
-                    del sequence["otu"]
-                    del sequence["otu_id"]
-                    del sequence["isolate_id"]
+            del sequence["otu"]
+            del sequence["otu_id"]
+            del sequence["isolate_id"]
 
-    document["results"] = [formatted[otu_id] for otu_id in formatted]
+    document["results"] = list(formatted.values())
 
     for otu in document["results"]:
-        for isolate in list(otu["isolates"]):
-            if not any((key in sequence for sequence in isolate["sequences"]) for key in ("pi", "final")):
-                otu["isolates"].remove(isolate)
-                continue
+        otu["isolates"] = [
+            isolate for isolate in otu["isolates"]
+            if any(key in sequence for sequence in isolate["sequences"] for key in ("pi", "final"))
+        ]
 
+        for isolate in otu["isolates"]:
             for sequence in isolate["sequences"]:
                 if "final" in sequence:
                     sequence.update(sequence.pop("final"))
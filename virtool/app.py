@@ -112,7 +112,10 @@ async def init_executors(app: web.Application):
     """
     loop = asyncio.get_event_loop()
 
-    thread_executor = concurrent.futures.ThreadPoolExecutor(max_workers=5)
+    thread_executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=app["settings"]["io_threads"] or None,
+        thread_name_prefix="virtool"
+    )
 
     loop.set_default_executor(thread_executor)
 
@@ -239,6 +242,8 @@ async def init_check_db(app):
     await db.history.create_index("created_at")
     await db.history.create_index([("otu.name", 1)])
     await db.history.create_index([("otu.version", -1)])
+    await db.history.create_index([("reference.id", pymongo.ASCENDING), ("index.id", pymongo.ASCENDING)])
+    await db.hmm.create_index("cluster")
     await db.indexes.drop_indexes()
     await db.indexes.create_index([("version", 1), ("reference.id", 1)], unique=True)
     await db.keys.create_index("id", unique=True)
@@ -250,6 +255,7 @@ async def init_check_db(app):
     await db.otus.create_index("name")
     await db.otus.create_index("nickname")
     await db.otus.create_index("abbreviation")
+    await db.otus.create_index("reference.id")
     await db.samples.create_index([("created_at", pymongo.DESCENDING)])
     await db.sequences.create_index("otu_id")
     await db.sequences.create_index("name")
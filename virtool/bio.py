@@ -26,6 +26,12 @@ COMPLEMENT_TABLE = {
     "N": "N"
 }
 
+#: Matches runs of at least 100 amino acids that contain no stop codon (``*``).
+ORF_RE = re.compile(r"[^*]{100,}")
+
+#: A :meth:`str.translate` table built from :data:`COMPLEMENT_TABLE`.
+COMPLEMENT_TRANS = str.maketrans(COMPLEMENT_TABLE)
+
 #: A standard translation table, including ambiguity.
 TRANSLATION_TABLE = {
     "TTT": "F",
@@ -248,10 +254,7 @@ def reverse_complement(sequence: str) -> str:
     :param sequence: the sequence to transform
     :return: the reverse complement
     """
-    complement = [COMPLEMENT_TABLE[s] for s in sequence.upper()]
-    complement.reverse()
-
-    return "".join(complement)
+    return sequence.upper().translate(COMPLEMENT_TRANS)[::-1]
 
 
 def translate(sequence: str) -> str:
@@ -264,15 +267,10 @@ def translate(sequence: str) -> str:
     """
     sequence = sequence.upper()
 
-    protein = list()
+    get = TRANSLATION_TABLE.get
 
-    for i in range(0, len(sequence) // 3):
-        codon = sequence[i * 3:(i + 1) * 3]
-
-        # Translate to X if the codon matches no amino acid (taking into account ambiguous codons where possible)
-        protein.append(TRANSLATION_TABLE.get(codon, "X"))
-
-    return "".join(protein)
+    # Translate to X if the codon matches no amino acid (taking into account ambiguous codons where possible)
+    return "".join([get(sequence[i:i + 3], "X") for i in range(0, len(sequence) - len(sequence) % 3, 3)])
 
 
 def find_orfs(sequence: str) -> List[dict]:
@@ -294,33 +292,25 @@ def find_orfs(sequence: str) -> List[dict]:
             # Look in all three translation frames.
             for frame in range(3):
                 translation = translate(nuc[frame:])
-                translation_length = len(translation)
-
-                aa_start = 0
-
-                # Extract ORFs.
-                while aa_start < translation_length:
-                    aa_end = translation.find("*", aa_start)
-
-                    if aa_end == -1:
-                        aa_end = translation_length
-                    if aa_end - aa_start >= 100:
-                        if strand == 1:
-                            start = frame + aa_start * 3
-                            end = min(sequence_length, frame + aa_end * 3 + 3)
-                        else:
-                            start = sequence_length - frame - aa_end * 3 - 3
-                            end = sequence_length - frame - aa_start * 3
-
-                        orfs.append({
-                            "pro": str(translation[aa_start:aa_end]),
-                            "nuc": str(nuc[start:end]),
-                            "frame": frame,
-                            "strand": strand,
-                            "pos": (start, end)
-                        })
-
-                    aa_start = aa_end + 1
+
+                # Extract ORFs. Each match is a stretch of at least 100 residues between stop codons.
+                for match in ORF_RE.finditer(translation):
+                    aa_start, aa_end = match.span()
+
+                    if strand == 1:
+                        start = frame + aa_start * 3
+                        end = min(sequence_length, frame + aa_end * 3 + 3)
+                    else:
+                        start = sequence_length - frame - aa_end * 3 - 3
+                        end = sequence_length - frame - aa_start * 3
+
+                    orfs.append({
+                        "pro": match.group(),
+                        "nuc": nuc[start:end],
+                        "frame": frame,
+                        "strand": strand,
+                        "pos": (start, end)
+                    })
 
     return orfs
 
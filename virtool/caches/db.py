@@ -1,21 +1,29 @@
 import aiohttp.web
+import asyncio
 import hashlib
 import json
 import os
+from typing import List, Union
 
 import pymongo.errors
 
 import virtool.utils
 
-PROJECTION = [
-    "_id",
-    "created_at",
-    "files",
-    "hash",
-    "program",
-    "ready",
-    "sample"
-]
+#: A MongoDB projection for cache documents. Defined as a `dict` so it can be passed to PyMongo without conversion.
+PROJECTION = {
+    "_id": True,
+    "created_at": True,
+    "files": True,
+    "hash": True,
+    "program": True,
+    "ready": True,
+    "sample": True
+}
+
+#: A reusable encoder for hashing cache parameters. :func:`json.dumps` builds a new encoder on every call when any
+#: options are passed. The output must stay identical to ``json.dumps(parameters, sort_keys=True)`` so that existing
+#: cache hashes remain valid.
+HASH_ENCODER = json.JSONEncoder(sort_keys=True)
 
 
 def calculate_cache_hash(parameters: dict) -> str:
@@ -27,41 +35,99 @@ def calculate_cache_hash(parameters: dict) -> str:
     :return: the cache hash
 
     """
-    string = json.dumps(parameters, sort_keys=True)
+    string = HASH_ENCODER.encode(parameters)
     return hashlib.sha1(string.encode()).hexdigest()
 
 
-def create(db, sample_id: str, parameters: dict, paired: bool, legacy: bool = False, program: str = "skewer-0.2.2"):
+def calculate_cache_hashes(parameters_list: List[dict]) -> List[str]:
+    """
+    Calculate cache hashes for many sets of trimming parameters. Returns hashes identical to those returned by
+    :func:`calculate_cache_hash`, in the same order as `parameters_list`.
+
+    Identical parameter sets are only serialized and hashed once.
+
+    :param parameters_list: the trimming parameters to hash
+    :return: the cache hashes
+
+    """
+    strings = [HASH_ENCODER.encode(parameters) for parameters in parameters_list]
+
+    hashes = {string: hashlib.sha1(string.encode()).hexdigest() for string in set(strings)}
+
+    return [hashes[string] for string in strings]
+
+
+def compose_document(
+        sample_id: str,
+        parameters: dict,
+        paired: bool,
+        legacy: bool = False,
+        program: str = "skewer-0.2.2",
+        cache_hash: Union[str, None] = None
+) -> dict:
+    """
+    Compose a new cache database document with a newly generated id. The document is not inserted.
+
+    :param sample_id: the id of the sample the cache is derived from
+    :param parameters: the trim parameters
+    :param paired: boolean indicating if the sample contains paired data
+    :param legacy: boolean indicating if the cache is derived from a trimmed legacy sample
+    :param program: the trimming program used
+    :param cache_hash: a precomputed hash of `parameters`
+    :return: the new cache document
+
+    """
+    return {
+        "_id": virtool.utils.random_alphanumeric(length=8),
+        "created_at": virtool.utils.timestamp(),
+        "files": list(),
+        "hash": cache_hash or calculate_cache_hash(parameters),
+        "legacy": legacy,
+        "missing": False,
+        "paired": paired,
+        "parameters": parameters,
+        "program": program,
+        "ready": False,
+        "sample": {
+            "id": sample_id
+        }
+    }
+
+
+def create(
+        db,
+        sample_id: str,
+        parameters: dict,
+        paired: bool,
+        legacy: bool = False,
+        program: str = "skewer-0.2.2",
+        cache_hash: Union[str, None] = None
+):
     """
     Create and insert a new cache database document. Return the generated unique cache id.
 
+    Pass `cache_hash` if the hash of `parameters` has already been calculated (eg. by
+    :func:`virtool.jobs.utils.find_cache`) to avoid calculating it again.
+
     :param db: the application database client
     :param sample_id: the id of the sample the cache is derived from
     :param parameters: the trim parameters
     :param paired: boolean indicating if the sample contains paired data
     :param legacy: boolean indicating if the cache is derived from a trimmed legacy sample
     :param program: the trimming program used
+    :param cache_hash: a precomputed hash of `parameters`
     :return: the new cache id
 
     """
     try:
-        cache_id = virtool.utils.random_alphanumeric(length=8)
-
-        document = {
-            "_id": cache_id,
-            "created_at": virtool.utils.timestamp(),
-            "files": list(),
-            "hash": calculate_cache_hash(parameters),
-            "legacy": legacy,
-            "missing": False,
-            "paired": paired,
-            "parameters": parameters,
-            "program": program,
-            "ready": False,
-            "sample": {
-                "id": sample_id
-            }
-        }
+        document = compose_document(
+            sample_id,
+            parameters,
+            paired,
+            legacy=legacy,
+            program=program,
+            cache_hash=cache_hash
+        )
 
         db.caches.insert_one(document)
 
@@ -69,7 +135,7 @@ def create(db, sample_id: str, parameters: dict, paired: bool, legacy: bool = Fa
 
     except pymongo.errors.DuplicateKeyError:
         # Keep trying to add the cache with new ids if the generated id is not unique.
-        return create(db, sample_id, parameters, paired, legacy=legacy, program=program)
+        return create(db, sample_id, parameters, paired, legacy=legacy, program=program, cache_hash=document["hash"])
 
 
 async def get(db, cache_id: str) -> dict:
@@ -96,13 +162,15 @@ async def remove(app: aiohttp.web.Application, cache_id: str):
     db = app["db"]
     settings = app["settings"]
 
-    await db.caches.delete_one({
-        "_id": cache_id
-    })
-
     path = os.path.join(settings["data_path"], "caches", cache_id)
 
-    try:
-        await app["run_in_thread"](virtool.utils.rm, path, True)
-    except FileNotFoundError:
-        pass
+    # The database document and the cache files are independent, so remove them concurrently.
+    results = await asyncio.gather(
+        db.caches.delete_one({"_id": cache_id}),
+        app["run_in_thread"](virtool.utils.rm, path, True),
+        return_exceptions=True
+    )
+
+    for result in results:
+        if isinstance(result, Exception) and not isinstance(result, FileNotFoundError):
+            raise result
@@ -47,6 +47,13 @@ SCHEMA = {
         "default": 8
     },
 
+    # The size of the thread pool used for blocking calls. Zero uses the interpreter default.
+    "io_threads": {
+        "type": "integer",
+        "coerce": int,
+        "default": 0
+    },
+
     # Job Limits
     "lg_proc": {
         "type": "integer",
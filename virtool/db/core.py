@@ -1,3 +1,5 @@
+import asyncio
+
 import motor.motor_asyncio
 import pymongo
 import pymongo.errors
@@ -193,7 +195,7 @@ class Collection:
         except pymongo.errors.DuplicateKeyError:
             if generate_id:
                 document.pop("_id")
-                return await self._collection.insert_one(document)
+                return await self.insert_one(document, silent=silent)
 
             raise
 
@@ -215,17 +217,23 @@ class Collection:
         return document
 
     async def update_many(self, query, update, silent=False):
+        if silent or self.silent:
+            return await self._collection.update_many(query, update)
+
         updated_ids = await self._collection.distinct("_id", query)
 
         update_result = await self._collection.update_many(query, update)
 
-        if not silent and not self.silent:
-            async for document in self._collection.find({"_id": {"$in": updated_ids}}, projection=self.projection):
-                await self.dispatch(
-                    self.name,
-                    "update",
-                    await self.apply_processor(document)
-                )
+        documents = await self._collection.find(
+            {"_id": {"$in": updated_ids}},
+            projection=self.projection
+        ).to_list(None)
+
+        # Process all documents before dispatching so that messages are still sent in order.
+        processed = await asyncio.gather(*[self.apply_processor(document) for document in documents])
+
+        for document in processed:
+            await self.dispatch(self.name, "update", document)
 
         return update_result
 
@@ -45,7 +45,7 @@ async def migrate_files(db):
     """
     logger.info(" • files")
 
-    await db.files.update_many({}, {
+    await db.files.update_many({"reserved": {"$ne": False}}, {
         "$set": {
             "reserved": False
         }
@@ -62,18 +62,22 @@ async def migrate_groups(db):
     """
     logger.info(" • groups")
 
-    await db.groups.update_many({}, {
+    await db.groups.update_many({"_version": {"$exists": True}}, {
         "$unset": {
             "_version": ""
         }
     })
 
-    async for group in db.groups.find():
-        await db.groups.update_one({"_id": group["_id"]}, {
-            "$set": {
-                "permissions": {perm: group["permissions"].get(perm, False) for perm in virtool.users.utils.PERMISSIONS}
-            }
-        }, silent=True)
+    async for group in db.groups.find({}, ["permissions"]):
+        permissions = {perm: group["permissions"].get(perm, False) for perm in virtool.users.utils.PERMISSIONS}
+
+        # Only rewrite groups whose permissions don't already match.
+        if permissions != group["permissions"]:
+            await db.groups.update_one({"_id": group["_id"]}, {
+                "$set": {
+                    "permissions": permissions
+                }
+            }, silent=True)
 
 
 async def migrate_jobs(db):
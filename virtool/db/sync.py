@@ -3,7 +3,6 @@ Synchronous helper functions for working with the database using pymongo. These
 not used.
 
 """
-import json
 from copy import deepcopy
 from typing import Union
 
@@ -118,6 +117,29 @@ def join_otu(db, query, document=None):
     return virtool.otus.utils.merge_otu(document, sequences)
 
 
+def get_unchanged_otus(db, manifest: dict) -> dict:
+    """
+    Find the OTUs in the passed `manifest` that are still at their manifest version and don't need to be patched.
+
+    The returned `dict` maps the ids of those OTUs to sets of their isolate ids. Sequences belonging to unchanged OTUs
+    can then be fetched with a single query instead of a join and history lookup per OTU.
+
+    :param db: the application database object
+    :param manifest: a `dict` of OTU versions keyed by OTU id
+    :return: sets of isolate ids keyed by the ids of unchanged OTUs
+
+    """
+    current = {
+        document["_id"]: document for document in
+        db.otus.find({"_id": {"$in": list(manifest)}}, ["version", "isolates.id"])
+    }
+
+    return {
+        otu_id: {isolate["id"] for isolate in current[otu_id]["isolates"]} for otu_id, otu_version in manifest.items()
+        if otu_id in current and current[otu_id]["version"] == otu_version
+    }
+
+
 def patch_otu_to_version(db, settings: dict, otu_id: str, version: Union[str, int]) -> tuple:
     """
     Take a joined otu back in time to the passed ``version``. Uses the diffs in the change documents associated with
@@ -186,8 +208,7 @@ def read_diff_file(data_path: str, otu_id: str, otu_version: Union[int, str]) ->
         otu_version
     )
 
-    with open(path, "r") as f:
-        return json.load(f, object_hook=virtool.history.utils.json_object_hook)
+    return virtool.history.utils.load_diff_file(path)
 
 
 def recalculate_workflow_tags(db, sample_id: str):
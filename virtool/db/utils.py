@@ -1,9 +1,14 @@
 import virtool.utils
+import pymongo.errors
 import semver
 import sys
+from typing import List
 
 MINIMUM_MONGO_VERSION = "3.6.0"
 
+#: The MongoDB error code for duplicate key errors.
+DUPLICATE_KEY_ERROR_CODE = 11000
+
 
 def apply_projection(document, projection):
     """
@@ -79,6 +84,53 @@ async def get_new_id(collection, excluded=None):
     return virtool.utils.random_alphanumeric(length=8, excluded=excluded)
 
 
+async def insert_many_with_ids(collection, documents: List[dict]) -> List[dict]:
+    """
+    Insert `documents` using a single unordered `insert_many` call. Documents without an `_id` are given a random
+    alphanumeric id like the ones generated by :meth:`virtool.db.core.Collection.insert_one`. Documents that fail to
+    insert because their generated id already exists are retried with new ids.
+
+    No websocket messages are dispatched for the inserted documents.
+
+    :param collection: the collection to insert the documents into
+    :param documents: the documents to insert
+    :return: the inserted documents
+
+    """
+    if not documents:
+        return documents
+
+    generated_ids = set()
+
+    for document in documents:
+        if "_id" not in document:
+            document["_id"] = virtool.utils.random_alphanumeric(8)
+            generated_ids.add(id(document))
+
+    pending = documents
+
+    while pending:
+        try:
+            await collection.insert_many(pending, ordered=False)
+            break
+        except pymongo.errors.BulkWriteError as err:
+            write_errors = err.details["writeErrors"]
+
+            failed = [pending[e["index"]] for e in write_errors]
+
+            # Only documents whose ids were generated here can be retried with a new id.
+            for write_error, document in zip(write_errors, failed):
+                if write_error["code"] != DUPLICATE_KEY_ERROR_CODE or id(document) not in generated_ids:
+                    raise
+
+            for document in failed:
+                document["_id"] = virtool.utils.random_alphanumeric(8)
+
+            pending = failed
+
+    return documents
+
+
 async def get_one_field(collection, field, query):
     projected = await collection.find_one(query, [field])
 
@@ -2,24 +2,24 @@ import logging
 from typing import Union
 
 import arrow
+import pymongo.errors
 
 import virtool.db.core
-import virtool.db.utils
 import virtool.files.utils
 import virtool.utils
 
 logger = logging.getLogger(__name__)
 
-PROJECTION = [
-    "_id",
-    "name",
-    "size",
-    "user",
-    "uploaded_at",
-    "type",
-    "ready",
-    "reserved"
-]
+PROJECTION = {
+    "_id": True,
+    "name": True,
+    "size": True,
+    "user": True,
+    "uploaded_at": True,
+    "type": True,
+    "ready": True,
+    "reserved": True
+}
 
 
 async def generate_file_id(db, filename: str) -> str:
@@ -32,7 +32,7 @@ async def generate_file_id(db, filename: str) -> str:
     :return: the file id
 
     """
-    prefix = await virtool.db.utils.get_new_id(db.files)
+    prefix = virtool.utils.random_alphanumeric(8)
     file_id = f"{prefix}-{filename}"
 
     if await db.files.count_documents({"_id": file_id}):
@@ -53,8 +53,6 @@ async def create(db, filename: str, file_type: str, reserved: bool = False, user
     :return: the file document
 
     """
-    file_id = await generate_file_id(db, filename)
-
     uploaded_at = virtool.utils.timestamp()
 
     expires_at = None
@@ -70,7 +68,6 @@ async def create(db, filename: str, file_type: str, reserved: bool = False, user
         }
 
     document = {
-        "_id": file_id,
         "name": filename,
         "type": file_type,
         "user": user,
@@ -81,10 +78,18 @@ async def create(db, filename: str, file_type: str, reserved: bool = False, user
         "ready": False
     }
 
-    await db.files.insert_one(document)
+    # The unique `_id` index catches an id taken by a concurrent upload after it was generated.
+    while True:
+        document["_id"] = await generate_file_id(db, filename)
+
+        try:
+            await db.files.insert_one(document)
+            break
+        except pymongo.errors.DuplicateKeyError:
+            pass
 
     # Return document will all keys, but size.
-    document = {key: document[key] for key in [key for key in PROJECTION if key != "size"]}
+    document = {key: document[key] for key in PROJECTION if key != "size"}
 
     return virtool.utils.base_processor(document)
 
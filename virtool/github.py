@@ -1,3 +1,4 @@
+import collections
 import logging
 from typing import Union
 
@@ -9,29 +10,37 @@ logger = logging.getLogger(__name__)
 
 BASE_URL = "https://api.github.com/repos"
 
-EXCLUDED_UPDATE_FIELDS = (
+EXCLUDED_UPDATE_FIELDS = frozenset((
     "content_type",
     "download_url",
     "etag",
     "retrieved_at"
-)
+))
 
 HEADERS = {
     "Accept": "application/vnd.github.v3+json"
 }
 
+#: The maximum number of parsed releases to keep in :data:`RELEASE_CACHE`.
+RELEASE_CACHE_SIZE = 64
+
+#: Parsed releases keyed by slug, release id, and ETag. Used to skip parsing the body of a `200` response that carries
+#: an ETag that has already been seen.
+RELEASE_CACHE = collections.OrderedDict()
+
 
 def create_update_subdocument(release, ready, user_id, created_at=None):
-    update = {k: release[k] for k in release if k not in EXCLUDED_UPDATE_FIELDS}
+    update = {k: v for k, v in release.items() if k not in EXCLUDED_UPDATE_FIELDS}
 
-    return {
-        **update,
+    update.update({
         "created_at": created_at or virtool.utils.timestamp(),
         "ready": ready,
         "user": {
             "id": user_id
         }
-    }
+    })
+
+    return update
 
 
 def format_release(release: dict) -> dict:
@@ -109,12 +118,26 @@ async def get_release(settings, session, slug, etag=None, release_id="latest"):
         logger.debug(f"Fetched release: {slug}/{release_id} ({resp.status} - {rate_limit_remaining}/{rate_limit})")
 
         if resp.status == 200:
+            key = (slug, str(release_id), resp.headers["etag"])
+
+            if key in RELEASE_CACHE:
+                RELEASE_CACHE.move_to_end(key)
+                await resp.release()
+                return dict(RELEASE_CACHE[key])
+
             data = await resp.json()
 
             if len(data["assets"]) == 0:
                 return None
 
-            return dict(data, etag=resp.headers["etag"])
+            release = dict(data, etag=resp.headers["etag"])
+
+            RELEASE_CACHE[key] = release
+
+            if len(RELEASE_CACHE) > RELEASE_CACHE_SIZE:
+                RELEASE_CACHE.popitem(last=False)
+
+            return dict(release)
 
         elif resp.status == 304:
             return None
@@ -4,6 +4,7 @@ from typing import Union, List
 import dictdiffer
 import pymongo.errors
 
+import virtool.db.utils
 import virtool.otus.db
 import virtool.errors
 import virtool.history.utils
@@ -36,30 +37,24 @@ PROJECTION = LIST_PROJECTION + [
 ]
 
 
-async def add(
-        app,
+def compose_document(
         method_name: str,
         old: Union[None, dict],
         new: Union[None, dict],
         description: str,
-        user_id: str,
-        silent: bool = False
+        user_id: str
 ) -> dict:
     """
-    Add a change document to the history collection.
+    Compose a change document for the history collection without inserting it.
 
-    :param app: the application object
     :param method_name: the name of the handler method that executed the change
     :param old: the otu document prior to the change
     :param new: the otu document after the change
     :param description: a human readable description of the change
     :param user_id: the id of the requesting user
-    :param silent: don't dispatch a message
     :return: the change document
 
     """
-    db = app["db"]
-
     otu_id, otu_name, otu_version, ref_id = virtool.history.utils.derive_otu_information(old, new)
 
     document = {
@@ -93,13 +88,28 @@ async def add(
     else:
         document["diff"] = virtool.history.utils.calculate_diff(old, new)
 
+    return document
+
+
+async def insert_document(app, document: dict, silent: bool = False) -> dict:
+    """
+    Insert a composed change document. The diff is written to a file instead if the document is too large to store.
+
+    :param app: the application object
+    :param document: the change document to insert
+    :param silent: don't dispatch a message
+    :return: the change document
+
+    """
+    db = app["db"]
+
     try:
         await db.history.insert_one(document, silent=silent)
     except pymongo.errors.DocumentTooLarge:
         await virtool.history.utils.write_diff_file(
             app["settings"]["data_path"],
-            otu_id,
-            otu_version,
+            document["otu"]["id"],
+            document["otu"]["version"],
             document["diff"]
         )
 
@@ -108,6 +118,63 @@ async def add(
     return document
 
 
+async def add(
+        app,
+        method_name: str,
+        old: Union[None, dict],
+        new: Union[None, dict],
+        description: str,
+        user_id: str,
+        silent: bool = False
+) -> dict:
+    """
+    Add a change document to the history collection.
+
+    :param app: the application object
+    :param method_name: the name of the handler method that executed the change
+    :param old: the otu document prior to the change
+    :param new: the otu document after the change
+    :param description: a human readable description of the change
+    :param user_id: the id of the requesting user
+    :param silent: don't dispatch a message
+    :return: the change document
+
+    """
+    document = compose_document(method_name, old, new, description, user_id)
+
+    return await insert_document(app, document, silent=silent)
+
+
+async def add_many(app, documents: List[dict]):
+    """
+    Insert many composed change documents using a single unordered `insert_many` call. No messages are dispatched.
+
+    If any document is too large to store, the batch is retried one document at a time so that oversized diffs can be
+    written to files. Change ids are deterministic, so documents that were already inserted are skipped.
+
+    :param app: the application object
+    :param documents: the change documents to insert
+
+    """
+    if not documents:
+        return
+
+    db = app["db"]
+
+    try:
+        await db.history.insert_many(documents, ordered=False)
+    except pymongo.errors.BulkWriteError as err:
+        # A duplicate id means the same change was already recorded, as when a failed process is retried.
+        if any(error["code"] != virtool.db.utils.DUPLICATE_KEY_ERROR_CODE for error in err.details["writeErrors"]):
+            raise
+    except pymongo.errors.DocumentTooLarge:
+        for document in documents:
+            try:
+                await insert_document(app, document, silent=True)
+            except pymongo.errors.DuplicateKeyError:
+                pass
+
+
 async def find(db, req_query, base_query=None):
     data = await paginate(
         db.history,
@@ -1,3 +1,4 @@
+import asyncio
 import arrow
 from typing import Tuple, Union, List
 import datetime
@@ -174,22 +175,42 @@ def json_object_hook(o: dict) -> dict:
     :return: the parsed dict
 
     """
-    for key, value in o.items():
-        if key == "created_at":
-            o[key] = arrow.get(value).naive
+    try:
+        created_at = o["created_at"]
+    except KeyError:
+        return o
+
+    try:
+        # Diff files are written by :func:`json_encoder`, so the fixed-format parser handles almost every value.
+        o["created_at"] = datetime.datetime.fromisoformat(created_at).replace(tzinfo=None)
+    except (TypeError, ValueError):
+        o["created_at"] = arrow.get(created_at).naive
 
     return o
 
 
+def load_diff_file(path: str) -> dict:
+    """
+    Read and decode the history diff JSON file at `path`. Blocks, so call it in a thread from async code.
+
+    :param path: the path to the diff file
+    :return: the diff
+
+    """
+    with open(path, "rb") as f:
+        return json.loads(f.read(), object_hook=json_object_hook)
+
+
 async def read_diff_file(data_path, otu_id, otu_version):
     """
     Read a history diff JSON file.
 
+    The file is read and decoded in a single executor job.
+
     """
     path = join_diff_path(data_path, otu_id, otu_version)
 
-    async with aiofiles.open(path, "r") as f:
-        return json.loads(await f.read(), object_hook=json_object_hook)
+    return await asyncio.get_event_loop().run_in_executor(None, load_diff_file, path)
 
 
 async def remove_diff_files(app, id_list: List[str]):
@@ -122,11 +122,15 @@ class Job(virtool.jobs.job.Job):
             self.params["sample_read_length"]
         )
 
+        # Hash the parameters once for both finding and creating the cache.
+        cache_hash = virtool.caches.db.calculate_cache_hash(parameters)
+
         cache = virtool.jobs.utils.find_cache(
             self.db,
             self.params["sample_id"],
             TRIMMING_PROGRAM,
-            parameters
+            parameters,
+            cache_hash=cache_hash
         )
 
         if cache:
@@ -139,7 +143,7 @@ class Job(virtool.jobs.job.Job):
             self.params["read_paths"] = self._fetch_legacy(paths)
             return
 
-        return self._create_cache(parameters)
+        return self._create_cache(parameters, cache_hash)
 
     def cleanup(self):
         cache_id = self.intermediate.get("cache_id")
@@ -168,12 +172,13 @@ class Job(virtool.jobs.job.Job):
 
         self.dispatch("samples", "update", [sample_id])
 
-    def _create_cache(self, parameters):
+    def _create_cache(self, parameters, cache_hash=None):
         cache = virtool.caches.db.create(
             self.db,
             self.params["sample_id"],
             parameters,
-            self.params["paired"]
+            self.params["paired"],
+            cache_hash=cache_hash
         )
 
         cache_id = cache["id"]
@@ -313,7 +318,20 @@ class Job(virtool.jobs.job.Job):
 def get_sequence_otu_map(db, settings, manifest):
     sequence_otu_map = dict()
 
+    # OTUs that are still at their manifest version don't need to be patched. Their sequence ids are found with one
+    # query instead of a join and history lookup per OTU.
+    unchanged = virtool.db.sync.get_unchanged_otus(db, manifest)
+
+    for sequence in db.sequences.find({"otu_id": {"$in": list(unchanged)}}, ["otu_id", "isolate_id"]):
+        otu_id = sequence["otu_id"]
+
+        if sequence["isolate_id"] in unchanged[otu_id]:
+            sequence_otu_map[sequence["_id"]] = otu_id
+
     for otu_id, otu_version in manifest.items():
+        if otu_id in unchanged:
+            continue
+
         _, patched, _ = virtool.db.sync.patch_otu_to_version(
             db,
             settings,
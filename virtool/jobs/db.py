@@ -26,7 +26,8 @@ PROJECTION = [
 
 
 async def cancel(db, job_id):
-    document = await db.jobs.find_one(job_id, ["status"])
+    # Only the latest status entry is needed, so the rest of the status history is not fetched.
+    document = await db.jobs.find_one(job_id, {"status": {"$slice": -1}})
 
     latest = document["status"][-1]
 
@@ -147,11 +148,9 @@ async def processor(db, document: dict) -> dict:
 
     last_update = status[-1]
 
-    document.update({
-        "state": last_update["state"],
-        "stage": last_update["stage"],
-        "created_at": status[0]["timestamp"],
-        "progress": status[-1]["progress"]
-    })
+    document["state"] = last_update["state"]
+    document["stage"] = last_update["stage"]
+    document["created_at"] = status[0]["timestamp"]
+    document["progress"] = last_update["progress"]
 
     return virtool.utils.base_processor(document)
@@ -18,6 +18,9 @@ import pymongo
 import virtool.jobs.db
 import virtool.utils
 
+#: The approximate number of bytes of subprocess STDOUT to read before queueing the lines for handling.
+STDOUT_CHUNK_SIZE = 65536
+
 
 class Job(multiprocessing.Process):
     """
@@ -224,7 +227,7 @@ class Job(multiprocessing.Process):
             stdout_queue = queue.Queue()
 
             stdout_thread = threading.Thread(
-                target=watch_pipe,
+                target=watch_pipe_chunks,
                 args=(self._process.stdout, stdout_queue),
                 daemon=True
             )
@@ -244,8 +247,8 @@ class Job(multiprocessing.Process):
         while True:
             if stdout_queue:
                 while not stdout_queue.empty():
-                    out = stdout_queue.get()
-                    stdout_handler(out)
+                    for out in stdout_queue.get():
+                        stdout_handler(out)
 
             while not stderr_queue.empty():
                 err = stderr_queue.get()
@@ -433,3 +436,25 @@ def watch_pipe(stream: io.TextIOWrapper, q: queue.Queue):
             return
 
         q.put(line)
+
+
+def watch_pipe_chunks(stream: io.BufferedReader, q: queue.Queue, hint: int = STDOUT_CHUNK_SIZE):
+    """
+    Like :func:`watch_pipe`, but pushes lists of lines into the `q` instead of individual lines. Each list contains
+    roughly `hint` bytes of lines. This keeps queue overhead low for commands that write very large amounts of output
+    (eg. SAM) to STDOUT.
+
+    This function is intended to be run in a separate thread.
+
+    :param stream: a stdout file object
+    :param q: a queue to push lists of lines into
+    :param hint: the approximate number of bytes to read per list
+
+    """
+    while True:
+        lines = stream.readlines(hint)
+
+        if not lines:
+            return
+
+        q.put(lines)
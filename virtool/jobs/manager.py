@@ -1,6 +1,8 @@
 import asyncio
+import collections
 import logging
 import multiprocessing
+import queue
 
 import virtool.db.core
 import virtool.indexes.db
@@ -60,39 +62,18 @@ class IntegratedManager:
         #: A dict to store all the tracked job objects in.
         self._jobs = dict()
 
+        #: The tracked jobs that have not been started yet, in the order they were enqueued.
+        self._waiting = collections.OrderedDict()
+
+        #: The tracked jobs that have been started and whose processes have not exited yet.
+        self._running = dict()
+
     async def run(self):
         logging.debug("Started job manager")
 
         try:
             while True:
-                to_delete = list()
-
-                if len(self._jobs):
-                    available = get_available_resources(self.settings, self._jobs)
-
-                    for job_id, job in self._jobs.items():
-                        if not job["process"]:
-                            if job["proc"] <= available["proc"] and job["mem"] <= available["mem"]:
-                                job["process"] = job["class"](
-                                    self.db_connection_string,
-                                    self.db_name,
-                                    self.settings,
-                                    job_id,
-                                    self.queue
-                                )
-
-                                job["process"].start()
-
-                                break
-
-                        elif not job["process"].is_alive():
-                            to_delete.append(job_id)
-
-                for job_id in to_delete:
-                    del self._jobs[job_id]
-
-                if not self.queue.empty():
-                    msg = self.queue.get()
+                for msg in coalesce_messages(drain_queue(self.queue)):
                     await self.dispatch(*msg)
 
                 await asyncio.sleep(0.1)
@@ -100,14 +81,71 @@ class IntegratedManager:
         except asyncio.CancelledError:
             logging.debug("Cancelling running jobs")
 
-            for job_id in self._jobs:
-                job_process = self._jobs[job_id]["process"]
+            loop = asyncio.get_event_loop()
+
+            for job in self._running.values():
+                job_process = job["process"]
+
+                loop.remove_reader(job_process.sentinel)
 
                 if job_process.is_alive():
                     job_process.terminate()
 
         logging.debug("Closed job manager")
 
+    def handle_exit(self, job_id: str):
+        """
+        Called by the event loop when the process sentinel for the running job identified by `job_id` becomes ready,
+        which happens as soon as the process exits.
+
+        The process is joined and the job is no longer tracked. The released resources are immediately offered to the
+        waiting jobs.
+
+        :param job_id: the id of the job whose process exited
+
+        """
+        job = self._running.pop(job_id)
+
+        asyncio.get_event_loop().remove_reader(job["process"].sentinel)
+
+        job["process"].join()
+
+        del self._jobs[job_id]
+
+        self.start_waiting()
+
+    def start_waiting(self):
+        """
+        Start waiting jobs, in the order they were enqueued, for as long as there are enough resources available for
+        them. Jobs that need more resources than are available stay waiting.
+
+        Called when a job is enqueued and when a running job exits, the only times the outcome can change.
+
+        """
+        available = get_available_resources(self.settings, self._running)
+
+        loop = asyncio.get_event_loop()
+
+        for job_id, job in list(self._waiting.items()):
+            if job["proc"] <= available["proc"] and job["mem"] <= available["mem"]:
+                job["process"] = job["class"](
+                    self.db_connection_string,
+                    self.db_name,
+                    self.settings,
+                    job_id,
+                    self.queue
+                )
+
+                job["process"].start()
+
+                loop.add_reader(job["process"].sentinel, self.handle_exit, job_id)
+
+                del self._waiting[job_id]
+                self._running[job_id] = job
+
+                available["proc"] -= job["proc"]
+                available["mem"] -= job["mem"]
+
     async def enqueue(self, job_id):
         document = await self.db.jobs.find_one(job_id, ["task", "args", "proc", "mem"])
 
@@ -122,10 +160,14 @@ class IntegratedManager:
             "mem": document["mem"]
         }
 
+        self._waiting[job_id] = self._jobs[job_id]
+
+        self.start_waiting()
+
     async def dispatch(self, interface, operation, id_list):
 
         if operation == "delete":
-            await self._dispatch(interface, operation, id_list)
+            return await self._dispatch(interface, operation, id_list)
 
         collection = getattr(self.db, interface)
 
@@ -143,14 +185,59 @@ class IntegratedManager:
         :type job_id: str
 
         """
-        job = self._jobs.get(job_id)
-
-        if job:
-            if job["process"] and job["process"].is_alive():
-                job["process"].terminate()
-            else:
-                await virtool.jobs.db.cancel(self.db, job_id)
-                del self._jobs[job_id]
+        if job_id in self._running:
+            job_process = self._running[job_id]["process"]
+
+            if job_process.is_alive():
+                job_process.terminate()
+
+        elif job_id in self._waiting:
+            await virtool.jobs.db.cancel(self.db, job_id)
+            del self._waiting[job_id]
+            del self._jobs[job_id]
+
+
+def drain_queue(q: multiprocessing.Queue) -> list:
+    """
+    Get every message that is currently waiting in the job message queue without blocking.
+
+    Draining the queue on every iteration of the manager loop keeps job messages from backing up when jobs send them
+    faster than one per iteration.
+
+    :param q: the job message queue
+    :return: the waiting messages in the order they were sent
+
+    """
+    messages = list()
+
+    while True:
+        try:
+            messages.append(q.get_nowait())
+        except queue.Empty:
+            return messages
+
+
+def coalesce_messages(messages: list) -> list:
+    """
+    Merge consecutive job messages that share an interface and operation into a single message. Duplicate ids are
+    dropped, because dispatching an id sends the current state of its document.
+
+    Only consecutive messages are merged, so the order of operations on each interface is preserved.
+
+    :param messages: job messages in the order they were sent
+    :return: the coalesced messages
+
+    """
+    coalesced = list()
+
+    for interface, operation, id_list in messages:
+        if coalesced and coalesced[-1][:2] == (interface, operation):
+            merged = coalesced[-1][2]
+            merged.extend(i for i in id_list if i not in merged)
+        else:
+            coalesced.append((interface, operation, list(dict.fromkeys(id_list))))
+
+    return coalesced
 
 
 def get_available_resources(settings, jobs):
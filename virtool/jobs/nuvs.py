@@ -93,17 +93,14 @@ class Job(virtool.jobs.analysis.Job):
             unmapped_path = os.path.join(self.params["analysis_path"], "unmapped_hosts.fq")
             headers = virtool.bio.read_fastq_headers(unmapped_path)
 
-            unmapped_roots = {h.split(" ")[0] for h in headers}
+            unmapped_roots = {h.split(" ", 1)[0] for h in headers}
 
-            with open(os.path.join(self.params["analysis_path"], "unmapped_1.fq"), "w") as f:
-                for header, seq, quality in virtool.bio.read_fastq_from_path(self.params["read_paths"][0]):
-                    if header.split(" ")[0] in unmapped_roots:
-                        f.write("\n".join([header, seq, "+", quality]) + "\n")
-
-            with open(os.path.join(self.params["analysis_path"], "unmapped_2.fq"), "w") as f:
-                for header, seq, quality in virtool.bio.read_fastq_from_path(self.params["read_paths"][1]):
-                    if header.split(" ")[0] in unmapped_roots:
-                        f.write("\n".join([header, seq, "+", quality]) + "\n")
+            # Stream each mate file and keep only the reads whose mates were left unmapped.
+            for suffix, read_path in zip((1, 2), self.params["read_paths"]):
+                with open(os.path.join(self.params["analysis_path"], f"unmapped_{suffix}.fq"), "w") as f:
+                    for header, seq, quality in virtool.bio.read_fastq_from_path(read_path):
+                        if header.split(" ", 1)[0] in unmapped_roots:
+                            f.write(f"{header}\n{seq}\n+\n{quality}\n")
 
     def assemble(self):
         """
@@ -209,24 +206,19 @@ class Job(virtool.jobs.analysis.Job):
                     f.write(f">sequence_{entry['index']}.{orf['index']}\n{orf['pro']}\n")
 
     def prepare_hmm(self):
+        """
+        Copy the vFam profile HMMs from the data path to the analysis directory for use in :meth:`.vfam`.
 
+        """
         shutil.copy(os.path.join(self.settings["data_path"], "hmm", "profiles.hmm"), self.params["analysis_path"])
 
-        hmm_path = os.path.join(self.params["analysis_path"], "profiles.hmm")
-
-        command = [
-            "hmmpress",
-            hmm_path
-        ]
-
-        self.run_subprocess(command)
-
-        os.remove(hmm_path)
-
     def vfam(self):
         """
-        Searches for viral motifs in ORF translations generated by :meth:`.process_fasta`. Calls ``hmmscan`` and
-        searches against ``candidates.fa`` using the profile HMMs in ``data_path/hmm/vFam.hmm``.
+        Searches for viral motifs in ORF translations generated by :meth:`.process_fasta`. Calls ``hmmsearch`` with the
+        profile HMMs in ``profiles.hmm`` as queries against the ORFs in ``orfs.fa``.
+
+        The number of profiles is passed as ``-Z`` so E-values are calculated against the size of the HMM database, as
+        they would be by ``hmmscan``.
 
         Saves two files:
 
@@ -238,12 +230,19 @@ class Job(virtool.jobs.analysis.Job):
         # The path to output the hmmer results to.
         tsv_path = os.path.join(self.params["analysis_path"], "hmm.tsv")
 
+        profiles_path = os.path.join(self.params["analysis_path"], "profiles.hmm")
+
+        with open(profiles_path, "r") as f:
+            profile_count = sum(1 for line in f if line.startswith("NAME "))
+
         command = [
-            "hmmscan",
+            "hmmsearch",
             "--tblout", tsv_path,
             "--noali",
-            "--cpu", str(self.proc - 1),
-            os.path.join(self.params["analysis_path"], "profiles.hmm"),
+            # HMMER runs in serial mode without worker threads when passed ``--cpu 0``.
+            "--cpu", str(max(1, self.proc - 1)),
+            "-Z", str(profile_count),
+            profiles_path,
             os.path.join(self.params["analysis_path"], "orfs.fa")
         ]
 
@@ -254,17 +253,20 @@ class Job(virtool.jobs.analysis.Job):
         # Go through the raw HMMER results and annotate the HMM hits with data from the database.
         with open(tsv_path, "r") as hmm_file:
             for line in hmm_file:
-                if line.startswith("vFam"):
-                    line = line.split()
+                if line.startswith("#"):
+                    continue
 
-                    cluster_id = int(line[0].split("_")[1])
-                    annotation_id = (self.db.hmm.find_one({"cluster": int(cluster_id)}, {"_id": True}))["_id"]
+                line = line.split()
+
+                # The query name is the vFam profile and the target name is the ORF.
+                if line[2].startswith("vFam"):
+                    cluster_id = int(line[2].split("_")[1])
 
                     # Expecting sequence_0.0
-                    sequence_index, orf_index = (int(x) for x in line[2].split("_")[1].split("."))
+                    sequence_index, orf_index = (int(x) for x in line[0].split("_")[1].split("."))
 
                     hits[sequence_index][orf_index].append({
-                        "hit": annotation_id,
+                        "hit": cluster_id,
                         "full_e": float(line[4]),
                         "full_score": float(line[5]),
                         "full_bias": float(line[6]),
@@ -273,8 +275,19 @@ class Job(virtool.jobs.analysis.Job):
                         "best_score": float(line[9])
                     })
 
+        cluster_ids = {hit["hit"] for orfs in hits.values() for orf_hits in orfs.values() for hit in orf_hits}
+
+        # Get the annotation ids for all of the hit clusters in one query.
+        annotation_ids = {
+            document["cluster"]: document["_id"] for document in
+            self.db.hmm.find({"cluster": {"$in": list(cluster_ids)}}, ["cluster"])
+        }
+
         for sequence_index in hits:
             for orf_index in hits[sequence_index]:
+                for hit in hits[sequence_index][orf_index]:
+                    hit["hit"] = annotation_ids[hit["hit"]]
+
                 self.results[sequence_index]["orfs"][orf_index]["hits"] = hits[sequence_index][orf_index]
 
             sequence = self.results[sequence_index]
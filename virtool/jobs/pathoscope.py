@@ -5,6 +5,8 @@ Functions and job classes for sample analysis.
 import os
 import shlex
 
+import numpy as np
+
 import virtool.caches.db
 import virtool.db.sync
 import virtool.jobs.analysis
@@ -107,11 +109,26 @@ class Job(virtool.jobs.analysis.Job):
         # The ids of OTUs whose default sequences had mappings.
         otu_ids = {sequence_otu_map[sequence_id] for sequence_id in self.intermediate["to_otus"]}
 
+        manifest = self.params["manifest"]
+
+        # OTUs still at their manifest version are written from a single sequence query.
+        unchanged = virtool.db.sync.get_unchanged_otus(self.db, {otu_id: manifest[otu_id] for otu_id in otu_ids})
+
         # Get the database documents for the sequences
         with open(fasta_path, "w") as handle:
+            query = {"otu_id": {"$in": list(unchanged)}}
+
+            for sequence in self.db.sequences.find(query, ["otu_id", "isolate_id", "sequence"]):
+                if sequence["isolate_id"] in unchanged[sequence["otu_id"]]:
+                    handle.write(f">{sequence['_id']}\n{sequence['sequence']}\n")
+                    ref_lengths[sequence["_id"]] = len(sequence["sequence"])
+
             # Iterate through each otu id referenced by the hit sequence ids.
             for otu_id in otu_ids:
-                otu_version = self.params["manifest"][otu_id]
+                if otu_id in unchanged:
+                    continue
+
+                otu_version = manifest[otu_id]
                 _, patched, _ = virtool.db.sync.patch_otu_to_version(
                     self.db,
                     self.settings,
@@ -313,14 +330,16 @@ class Job(virtool.jobs.analysis.Job):
             # Get the coverage for the sequence.
             hit_coverage = self.intermediate["coverage"][ref_id]
 
+            hit_length = len(hit_coverage)
+
             # Attach coverage list to hit dict.
-            hit["align"] = hit_coverage
+            hit["align"] = hit_coverage.tolist()
 
             # Calculate coverage and attach to hit.
-            hit["coverage"] = round(1 - hit_coverage.count(0) / len(hit_coverage), 3)
+            hit["coverage"] = round(1 - (hit_length - int(np.count_nonzero(hit_coverage))) / hit_length, 3)
 
             # Calculate depth and attach to hit.
-            hit["depth"] = round(sum(hit_coverage) / len(hit_coverage))
+            hit["depth"] = round(int(hit_coverage.sum()) / hit_length)
 
             self.results["results"].append(hit)
 
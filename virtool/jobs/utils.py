@@ -86,7 +86,13 @@ def get_sample_params(db, settings: dict, task_args: dict) -> dict:
     return params
 
 
-def find_cache(db, sample_id: str, program: str, parameters: dict) -> Union[dict, None]:
+def find_cache(
+        db,
+        sample_id: str,
+        program: str,
+        parameters: dict,
+        cache_hash: Union[str, None] = None
+) -> Union[dict, None]:
     """
     Find a cache matching the passed `sample_id`, `program` name and version, and set of trimming `parameters`.
 
@@ -96,23 +102,26 @@ def find_cache(db, sample_id: str, program: str, parameters: dict) -> Union[dict
     :param sample_id: the id of the parent sample
     :param program: the program and version used to create the cache
     :param parameters: the parameters used for the trim
+    :param cache_hash: a precomputed hash of `parameters`
     :return: a cache document
 
     """
 
     document = db.caches.find_one({
-        "hash": virtool.caches.db.calculate_cache_hash(parameters),
+        "hash": cache_hash or virtool.caches.db.calculate_cache_hash(parameters),
         "missing": False,
         "program": program,
         "sample.id": sample_id
     })
 
-    if document:
+    if document and document["ready"] is False:
         cache_id = document["_id"]
 
-        while document["ready"] is False:
+        # Only poll the `ready` field. The complete document is fetched once when the cache is ready.
+        while not db.caches.find_one(cache_id, ["ready"])["ready"]:
             time.sleep(2)
-            document = db.caches.find_one(cache_id)
+
+        document = db.caches.find_one(cache_id)
 
     return virtool.utils.base_processor(document)
 
@@ -1,10 +1,13 @@
 import collections
 import copy
 import csv
+import itertools
 import math
 import os
 import shutil
 
+import numpy as np
+
 
 def rescale_samscore(u, nu, max_score, min_score):
     if min_score < 0:
@@ -50,7 +53,8 @@ def find_sam_align_score(fields):
     """
     read_length = float(len(fields[9]))
 
-    for field in fields:
+    # Optional tags such as ``AS:i`` only appear after the 11 mandatory SAM fields.
+    for field in itertools.islice(fields, 11, None):
         if field.startswith("AS:i:"):
             a_score = int(field[5:])
             return a_score + read_length
@@ -436,27 +440,44 @@ def rewrite_align(u, nu, vta_path, p_score_cutoff, path):
 
 
 def calculate_coverage(vta_path, ref_lengths):
-    coverage_dict = dict()
-    pos_length_list = list()
+    """
+    Calculate per-base coverage for each reference with alignments in the VTA file at `vta_path`.
+
+    Alignment starts and ends are accumulated into a difference array for each reference, which yields the coverage
+    with one cumulative sum instead of incrementing every covered position in Python.
+
+    :param vta_path: the path to the VTA file
+    :param ref_lengths: the lengths of the references keyed by reference id
+    :return: `numpy` integer arrays of per-base coverage keyed by reference id
+
+    """
+    alignments = collections.defaultdict(lambda: (list(), list()))
 
     with open(vta_path, "r") as old_handle:
         for line in old_handle:
             _, ref_id, pos, length, _ = line.split(",")
 
-            coverage_dict[ref_id] = None
-            pos_length_list.append((ref_id, int(pos), int(length)))
+            starts, lengths = alignments[ref_id]
+            starts.append(int(pos) - 1)
+            lengths.append(int(length))
+
+    coverage_dict = dict()
+
+    for ref_id, (starts, lengths) in alignments.items():
+        ref_length = ref_lengths[ref_id]
+
+        starts = np.array(starts, dtype=np.int64)
+        ends = np.minimum(starts + np.array(lengths, dtype=np.int64), ref_length)
+
+        # Positions beyond the end of the reference are not counted.
+        in_bounds = starts < ref_length
 
-    for key in coverage_dict:
-        coverage_dict[key] = [0] * ref_lengths[key]
+        diff = np.zeros(ref_length + 1, dtype=np.int64)
 
-    for ref_id, pos, length in pos_length_list:
-        start_index = pos - 1
+        np.add.at(diff, starts[in_bounds], 1)
+        np.add.at(diff, ends[in_bounds], -1)
 
-        for i in range(start_index, start_index + length):
-            try:
-                coverage_dict[ref_id][i] += 1
-            except IndexError:
-                pass
+        coverage_dict[ref_id] = np.cumsum(diff[:-1])
 
     return coverage_dict
 
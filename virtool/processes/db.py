@@ -1,14 +1,12 @@
 import virtool.processes.steps
-import virtool.db.utils
 import virtool.processes.process
 import virtool.utils
 
 
 async def register(db, process_type, context=None):
-    process_id = await virtool.db.utils.get_new_id(db.processes)
-
+    # The `_id` is left out so the database interface generates one on insert. This avoids fetching every existing
+    # process id to find an unused one.
     document = {
-        "_id": process_id,
         "complete": False,
         "count": 0,
         "created_at": virtool.utils.timestamp(),
@@ -19,33 +17,52 @@ async def register(db, process_type, context=None):
         "type": process_type
     }
 
-    await db.processes.insert_one(document)
+    document = await db.processes.insert_one(document)
 
     return virtool.utils.base_processor(document)
 
 
-async def update(db, process_id, count=None, progress=None, step=None, context_update=None, errors=None):
-    update_dict = dict()
+async def update(
+        db,
+        process_id,
+        count=None,
+        progress=None,
+        step=None,
+        context_update=None,
+        errors=None,
+        count_delta=None,
+        progress_delta=None
+):
+    fields = (
+        ("count", count),
+        ("progress", progress),
+        ("step", step),
+        ("errors", errors)
+    )
+
+    update_dict = {key: value for key, value in fields if value is not None}
 
-    if count is not None:
-        update_dict["count"] = count
+    if context_update:
+        for key, value in context_update.items():
+            update_dict[f"context.{key}"] = value
 
-    if progress is not None:
-        update_dict["progress"] = progress
+    # Deltas are applied atomically with `$inc` so callers tracking increments don't have to read the current values.
+    deltas = (
+        ("count", count_delta),
+        ("progress", progress_delta)
+    )
 
-    if step:
-        update_dict["step"] = step
+    inc_dict = {key: value for key, value in deltas if value is not None}
 
-    if errors is not None:
-        update_dict["errors"] = errors
+    update = dict()
 
-    if context_update:
-        for key, value in context_update.items():
-            update_dict[f"context.{key}"] = value
+    if update_dict:
+        update["$set"] = update_dict
 
-    document = await db.processes.find_one_and_update({"_id": process_id}, {
-        "$set": update_dict
-    })
+    if inc_dict:
+        update["$inc"] = inc_dict
+
+    document = await db.processes.find_one_and_update({"_id": process_id}, update)
 
     return virtool.utils.base_processor(document)
 
@@ -62,7 +62,7 @@ async def find(req):
         req.query,
         sort="name",
         base_query=base_query,
-        projection=virtool.references.db.PROJECTION
+        projection=virtool.references.db.LIST_PROJECTION
     )
 
     data["documents"] = [await virtool.references.db.processor(db, d) for d in data["documents"]]
@@ -162,7 +162,7 @@ async def update(req):
     context = {
         "created_at": created_at,
         "ref_id": ref_id,
-        "release": await virtool.db.utils.get_one_field(db.references, "release", ref_id),
+        "release": release,
         "user_id": user_id
     }
 
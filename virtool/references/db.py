@@ -1,13 +1,15 @@
 import asyncio
+import collections
+import datetime
 import json.decoder
 import logging
 import os
-from typing import List, Union
+from typing import Callable, List, Tuple, Union
 
 import aiohttp
 import aiojobs.aiohttp
 import pymongo
-import semver
+import pymongo.errors
 
 import virtool.api
 import virtool.db.utils
@@ -45,6 +47,36 @@ PROJECTION = [
     "user"
 ]
 
+#: A projection for reference list queries. Only the last update is needed by :func:`processor` to derive the
+#: `installed` field, so the rest of the `updates` array is not fetched.
+LIST_PROJECTION = {
+    **{field: True for field in PROJECTION},
+    "updates": {
+        "$slice": -1
+    }
+}
+
+#: The number of OTUs to insert in each batch when populating a reference.
+OTU_INSERT_CHUNK_SIZE = 500
+
+#: The maximum number of OTUs to patch to a specific version at the same time.
+PATCH_CONCURRENCY = 32
+
+#: The longest time an unchanged release's stored `retrieved_at` can go without being updated.
+RETRIEVED_AT_UPDATE_INTERVAL = datetime.timedelta(hours=1)
+
+#: The maximum number of remote references to refresh at the same time.
+REFRESH_CONCURRENCY = 8
+
+#: The number of OTU documents to fetch per batch when building a manifest. The documents only contain versions.
+MANIFEST_BATCH_SIZE = 5000
+
+#: The number of history documents to insert in each batch when updating a remote reference.
+HISTORY_INSERT_CHUNK_SIZE = 500
+
+#: The maximum number of OTUs to update at the same time when updating a remote reference.
+UPDATE_OTU_CONCURRENCY = 16
+
 
 class CloneReferenceProcess(virtool.processes.process.Process):
 
@@ -64,40 +96,44 @@ class CloneReferenceProcess(virtool.processes.process.Process):
 
         tracker = self.get_tracker(len(manifest))
 
-        inserted_otu_ids = list()
+        joined_otus = list()
 
-        for source_otu_id, version in manifest.items():
-            _, patched, _ = await virtool.history.db.patch_to_version(
-                self.app,
-                source_otu_id,
-                version
-            )
+        specifiers = list(manifest.items())
+
+        for i in range(0, len(specifiers), OTU_INSERT_CHUNK_SIZE):
+            patched_otus = await patch_many_to_versions(self.app, specifiers[i:i + OTU_INSERT_CHUNK_SIZE])
 
-            otu_id = await insert_joined_otu(
+            joined_otus += await insert_joined_otus(
                 self.db,
-                patched,
+                patched_otus,
                 created_at,
                 ref_id,
-                user_id
+                user_id,
+                progress_handler=tracker.add
             )
 
-            inserted_otu_ids.append(otu_id)
-
-            await tracker.add(1)
+        self.intermediate["joined_otus"] = {otu["_id"]: otu for otu in joined_otus}
 
         await self.update_context({
-            "inserted_otu_ids": inserted_otu_ids
+            "inserted_otu_ids": [otu["_id"] for otu in joined_otus]
         })
 
     async def create_history(self):
         user_id = self.context["user_id"]
         inserted_otu_ids = self.context["inserted_otu_ids"]
 
+        joined_otus = self.intermediate.get("joined_otus", dict())
+
         tracker = self.get_tracker(len(inserted_otu_ids))
 
-        for otu_id in inserted_otu_ids:
-            await insert_change(self.app, otu_id, "clone", user_id)
-            await tracker.add(1)
+        await insert_changes(
+            self.app,
+            inserted_otu_ids,
+            "clone",
+            user_id,
+            joined_otus=joined_otus,
+            progress_handler=tracker.add
+        )
 
     async def cleanup(self):
         ref_id = self.context["ref_id"]
@@ -204,32 +240,37 @@ class ImportReferenceProcess(virtool.processes.process.Process):
 
         tracker = self.get_tracker(len(otus))
 
-        inserted_otu_ids = list()
+        joined_otus = await insert_joined_otus(
+            self.db,
+            otus,
+            created_at,
+            ref_id,
+            user_id,
+            progress_handler=tracker.add
+        )
 
-        for otu in otus:
-            otu_id = await insert_joined_otu(self.db, otu, created_at, ref_id, user_id)
-            inserted_otu_ids.append(otu_id)
-            await tracker.add(1)
+        self.intermediate["joined_otus"] = {otu["_id"]: otu for otu in joined_otus}
 
         await self.update_context({
-            "inserted_otu_ids": inserted_otu_ids
+            "inserted_otu_ids": [otu["_id"] for otu in joined_otus]
         })
 
     async def create_history(self):
         inserted_otu_ids = self.context["inserted_otu_ids"]
         user_id = self.context["user_id"]
 
-        tracker = self.get_tracker(len(inserted_otu_ids))
+        joined_otus = self.intermediate.get("joined_otus", dict())
 
-        for otu_id in inserted_otu_ids:
-            await insert_change(
-                self.app,
-                otu_id,
-                "import",
-                user_id
-            )
+        tracker = self.get_tracker(len(inserted_otu_ids))
 
-            await tracker.add(1)
+        await insert_changes(
+            self.app,
+            inserted_otu_ids,
+            "import",
+            user_id,
+            joined_otus=joined_otus,
+            progress_handler=tracker.add
+        )
 
 
 class RemoveReferenceProcess(virtool.processes.process.Process):
@@ -286,16 +327,50 @@ class RemoveReferenceProcess(virtool.processes.process.Process):
 
         tracker = self.get_tracker(otu_count)
 
+        otu_ids = list()
+
+        # Removal history is still recorded for each OTU because analyses use it to recover the removed OTUs. The OTUs
+        # are joined and their change documents inserted in batches of `HISTORY_INSERT_CHUNK_SIZE`. The OTU and
+        # sequence documents are deleted together afterwards instead of one OTU at a time.
+        chunk = list()
+
+        async def flush():
+            sequences = collections.defaultdict(list)
+
+            async for sequence in self.db.sequences.find({"otu_id": {"$in": [otu["_id"] for otu in chunk]}}):
+                sequences[sequence["otu_id"]].append(sequence)
+
+            documents = list()
+
+            for otu in chunk:
+                joined = virtool.otus.utils.merge_otu(otu, sequences[otu["_id"]])
+
+                documents.append(virtool.history.db.compose_document(
+                    "remove",
+                    joined,
+                    None,
+                    virtool.history.utils.compose_remove_description(joined),
+                    user_id
+                ))
+
+            await virtool.history.db.add_many(self.app, documents)
+            await tracker.add(len(chunk))
+
         async for document in self.db.otus.find({"reference.id": ref_id}):
-            await virtool.otus.db.remove(
-                self.app,
-                document["_id"],
-                user_id,
-                document=document,
-                silent=True
-            )
+            chunk.append(document)
+            otu_ids.append(document["_id"])
 
-            await tracker.add(1)
+            if len(chunk) >= HISTORY_INSERT_CHUNK_SIZE:
+                await flush()
+                chunk = list()
+
+        if chunk:
+            await flush()
+
+        await asyncio.gather(
+            self.db.otus.delete_many({"_id": {"$in": otu_ids}}, silent=True),
+            self.db.sequences.delete_many({"otu_id": {"$in": otu_ids}}, silent=True)
+        )
 
 
 class UpdateRemoteReferenceProcess(virtool.processes.process.Process):
@@ -306,7 +381,6 @@ class UpdateRemoteReferenceProcess(virtool.processes.process.Process):
         self.steps = [
             self.download_and_extract,
             self.update_otus,
-            self.create_history,
             self.remove_otus,
             self.update_reference
         ]
@@ -349,85 +423,117 @@ class UpdateRemoteReferenceProcess(virtool.processes.process.Process):
         # The remote ids in the update otus.
         otu_ids_in_update = {otu["_id"] for otu in update_data["otus"]}
 
-        updated_list = list()
+        semaphore = asyncio.Semaphore(UPDATE_OTU_CONCURRENCY)
 
-        for otu in update_data["otus"]:
-            old_or_id = await update_joined_otu(
-                self.db,
-                otu,
-                self.context["created_at"],
-                self.context["ref_id"],
-                self.context["user_id"]
-            )
+        # History documents are composed as soon as each OTU is updated and inserted in batches of
+        # `HISTORY_INSERT_CHUNK_SIZE`.
+        documents = list()
 
-            if old_or_id is not None:
-                updated_list.append(old_or_id)
+        async def update_otu(otu):
+            nonlocal documents
 
-            await tracker.add(1)
+            async with semaphore:
+                old_or_id = await update_joined_otu(
+                    self.db,
+                    otu,
+                    self.context["created_at"],
+                    self.context["ref_id"],
+                    self.context["user_id"]
+                )
 
-        self.intermediate.update({
-            "otu_ids_in_update": otu_ids_in_update,
-            "updated_list": updated_list
-        })
+                if old_or_id is not None:
+                    try:
+                        otu_id = old_or_id["_id"]
+                        old = old_or_id
+                    except TypeError:
+                        otu_id = old_or_id
+                        old = None
 
-    async def create_history(self):
-        updated_list = self.intermediate["updated_list"]
+                    documents.append(await prepare_change(
+                        self.db,
+                        otu_id,
+                        "update" if old else "remote",
+                        self.context["user_id"],
+                        old
+                    ))
 
-        tracker = self.get_tracker(len(updated_list))
+                    if len(documents) >= HISTORY_INSERT_CHUNK_SIZE:
+                        full, documents = documents, list()
+                        await virtool.history.db.add_many(self.app, full)
 
-        for old_or_id in updated_list:
-            try:
-                otu_id = old_or_id["_id"]
-                old = old_or_id
-            except TypeError:
-                otu_id = old_or_id
-                old = None
-
-            await insert_change(
-                self.app,
-                otu_id,
-                "update" if old else "remote",
-                self.context["user_id"],
-                old
-            )
+                await tracker.add(1)
 
-            await tracker.add(1)
+        # Each OTU is matched by its own remote id, so the updates are independent and can overlap.
+        await asyncio.gather(*[update_otu(otu) for otu in update_data["otus"]])
+
+        await virtool.history.db.add_many(self.app, documents)
+
+        self.intermediate["otu_ids_in_update"] = otu_ids_in_update
 
     async def remove_otus(self):
-        # Delete OTUs with remote ids that were not in the update.
-        to_delete = await self.db.otus.distinct("_id", {
-            "reference.id": self.context["ref_id"],
-            "remote.id": {
-                "$nin": list(self.intermediate["otu_ids_in_update"])
-            }
-        })
+        otu_ids_in_update = self.intermediate["otu_ids_in_update"]
+
+        # Delete OTUs with remote ids that were not in the update. The difference is taken locally instead of sending
+        # every remote id in the update to the server in a `$nin` query.
+        cursor = self.db.otus.find({"reference.id": self.context["ref_id"]}, {"_id": True, "remote.id": True})
+
+        to_delete = [
+            document["_id"] async for document in cursor
+            if document.get("remote", {}).get("id") not in otu_ids_in_update
+        ]
 
         tracker = self.get_tracker(len(to_delete))
 
-        for otu_id in to_delete:
-            await virtool.otus.db.remove(
-                self.app,
-                otu_id,
-                self.context["user_id"]
+        for index in range(0, len(to_delete), HISTORY_INSERT_CHUNK_SIZE):
+            chunk = to_delete[index:index + HISTORY_INSERT_CHUNK_SIZE]
+
+            sequences = collections.defaultdict(list)
+
+            async for sequence in self.db.sequences.find({"otu_id": {"$in": chunk}}):
+                sequences[sequence["otu_id"]].append(sequence)
+
+            documents = list()
+
+            async for otu in self.db.otus.find({"_id": {"$in": chunk}}):
+                joined = virtool.otus.utils.merge_otu(otu, sequences[otu["_id"]])
+
+                documents.append(virtool.history.db.compose_document(
+                    "remove",
+                    joined,
+                    None,
+                    virtool.history.utils.compose_remove_description(joined),
+                    self.context["user_id"]
+                ))
+
+            await tracker.add(len(chunk))
+
+            await asyncio.gather(
+                virtool.history.db.add_many(self.app, documents),
+                self.db.otus.delete_many({"_id": {"$in": chunk}}),
+                self.db.sequences.delete_many({"otu_id": {"$in": chunk}}, silent=True)
             )
 
-            await tracker.add(1)
+        if to_delete:
+            # Unset the reference internal_control if it is one of the removed OTUs.
+            await self.db.references.update_one({
+                "_id": self.context["ref_id"],
+                "internal_control.id": {"$in": to_delete}
+            }, {
+                "$set": {
+                    "internal_control": None
+                }
+            })
 
     async def update_reference(self):
         ref_id = self.context["ref_id"]
         release = self.context["release"]
 
+        # The installed release can't be newer than itself, so it is stored directly instead of fetching it again.
         await self.db.references.update_one({"_id": ref_id, "updates.id": release["id"]}, {
             "$set": {
                 "installed": virtool.github.create_update_subdocument(release, True, self.context["user_id"]),
-                "updates.$.ready": True
-            }
-        })
-
-        await fetch_and_update_release(self.app, ref_id)
-
-        await self.db.references.update_one({"_id": ref_id}, {
-            "$set": {
+                "release": dict(release, newer=False, retrieved_at=virtool.utils.timestamp()),
+                "updates.$.ready": True,
                 "updating": False
             }
         })
@@ -545,22 +651,20 @@ async def check_source_type(db, ref_id: str, source_type: str) -> bool:
     :return: source type is valid
 
     """
+    # Unknown and empty source types are always valid. Don't query the database for them.
+    if source_type == "unknown" or not source_type:
+        return True
+
     document = await db.references.find_one(ref_id, ["restrict_source_types", "source_types"])
 
     restrict_source_types = document.get("restrict_source_types", False)
     source_types = document.get("source_types", list())
 
-    if source_type == "unknown":
-        return True
-
     # Return `False` when source_types are restricted and source_type is not allowed.
-    if source_type and restrict_source_types:
+    if restrict_source_types:
         return source_type in source_types
 
-    # Return `True` when:
-    # - source_type is empty string (unknown)
-    # - source_types are not restricted
-    # - source_type is an allowed source_type
+    # Return `True` when source_types are not restricted.
     return True
 
 
@@ -611,23 +715,17 @@ async def delete_group_or_user(db, ref_id: str, subdocument_id: str, field: str)
     :return: the id of the removed subdocument
 
     """
-    document = await db.references.find_one({
-        "_id": ref_id,
-        field + ".id": subdocument_id
-    }, [field])
-
-    if document is None:
-        return None
-
-    # Retain only the subdocuments that don't match the passed `subdocument_id`.
-    filtered = [s for s in document[field] if s["id"] != subdocument_id]
-
-    await db.references.update_one({"_id": ref_id}, {
-        "$set": {
-            field: filtered
+    update_result = await db.references.update_one({"_id": ref_id, field + ".id": subdocument_id}, {
+        "$pull": {
+            field: {
+                "id": subdocument_id
+            }
         }
     })
 
+    if not update_result.modified_count:
+        return None
+
     return subdocument_id
 
 
@@ -644,25 +742,26 @@ async def edit_group_or_user(db, ref_id: str, subdocument_id: str, field: str, d
     :return: the modified subdocument
 
     """
-    document = await db.references.find_one({
+    query = {
         "_id": ref_id,
         field + ".id": subdocument_id
-    }, [field])
+    }
+
+    # Rights missing from `data` are left unchanged.
+    rights = {key: data[key] for key in virtool.references.utils.RIGHTS if key in data}
+
+    if rights:
+        document = await db.references.find_one_and_update(query, {
+            "$set": {f"{field}.$.{key}": value for key, value in rights.items()}
+        }, projection=[field])
+    else:
+        document = await db.references.find_one(query, [field])
 
     if document is None:
         return None
 
     for subdocument in document[field]:
         if subdocument["id"] == subdocument_id:
-            rights = {key: data.get(key, subdocument[key]) for key in virtool.references.utils.RIGHTS}
-            subdocument.update(rights)
-
-            await db.references.update_one({"_id": ref_id}, {
-                "$set": {
-                    field: document[field]
-                }
-            })
-
             return subdocument
 
 
@@ -685,6 +784,7 @@ async def fetch_and_update_release(app, ref_id: str, ignore_errors: bool = False
     retrieved_at = virtool.utils.timestamp()
 
     document = await db.references.find_one(ref_id, [
+        "errors",
         "installed",
         "release",
         "remotes_from"
@@ -724,13 +824,30 @@ async def fetch_and_update_release(app, ref_id: str, ignore_errors: bool = False
     if release:
         installed = document["installed"]
 
-        release["newer"] = bool(
+        newer = bool(
             installed and
-            semver.compare(release["name"].lstrip("v"), installed["name"].lstrip("v")) == 1
+            virtool.references.utils.parse_release_version(release["name"]) >
+            virtool.references.utils.parse_release_version(installed["name"])
         )
 
+        last_retrieved_at = release.get("retrieved_at")
+
+        # Skip the database write when GitHub reports no new release (eg. 304 Not Modified) and none of the stored
+        # fields would change. The retrieval time is still written occasionally so it doesn't become stale.
+        unchanged = (
+            updated is None and
+            errors == document.get("errors", list()) and
+            newer == release.get("newer") and
+            last_retrieved_at is not None and
+            retrieved_at - last_retrieved_at < RETRIEVED_AT_UPDATE_INTERVAL
+        )
+
+        release["newer"] = newer
         release["retrieved_at"] = retrieved_at
 
+        if unchanged:
+            return release
+
     await db.references.update_one({"_id": ref_id}, {
         "$set": {
             "errors": errors,
@@ -757,12 +874,11 @@ async def attach_computed(db, document: dict) -> dict:
     except (KeyError, TypeError):
         internal_control_id = None
 
-    contributors, internal_control, latest_build, otu_count, unbuilt_count = await asyncio.gather(
-        get_contributors(db, ref_id),
+    (contributors, unbuilt_count), internal_control, latest_build, otu_count = await asyncio.gather(
+        get_contributors_and_unbuilt_count(db, ref_id),
         get_internal_control(db, internal_control_id, ref_id),
         get_latest_build(db, ref_id),
-        get_otu_count(db, ref_id),
-        get_unbuilt_count(db, ref_id)
+        get_otu_count(db, ref_id)
     )
 
     users = await virtool.users.db.attach_identicons(db, document["users"])
@@ -778,16 +894,42 @@ async def attach_computed(db, document: dict) -> dict:
     }
 
 
-async def get_contributors(db, ref_id: str) -> Union[None, List[dict]]:
+async def get_contributors_and_unbuilt_count(db, ref_id: str) -> Tuple[List[dict], int]:
     """
-    Return an list of contributors and their contribution count for a specific ref.
+    Return the contributors and the unbuilt change count for a reference. Both are derived from the reference's history
+    so they are calculated with a single aggregation.
 
     :param db: the application database client
-    :param ref_id: the id of the ref to get contributors for
-    :return: a list of contributors to the ref
+    :param ref_id: the id of the reference
+    :return: a list of contributors and the number of unbuilt changes
 
     """
-    return await virtool.history.db.get_contributors(db, {"reference.id": ref_id})
+    cursor = db.history.aggregate([
+        {"$match": {"reference.id": ref_id}},
+        {"$facet": {
+            "contributors": [
+                {"$group": {
+                    "_id": "$user.id",
+                    "count": {"$sum": 1}
+                }}
+            ],
+            "unbuilt": [
+                {"$match": {"index.id": "unbuilt"}},
+                {"$count": "count"}
+            ]
+        }}
+    ])
+
+    result = (await cursor.to_list(None))[0]
+
+    contributors = [{"id": c["_id"], "count": c["count"]} for c in result["contributors"]]
+
+    try:
+        unbuilt_count = result["unbuilt"][0]["count"]
+    except IndexError:
+        unbuilt_count = 0
+
+    return contributors, unbuilt_count
 
 
 async def get_internal_control(db, internal_control_id: Union[None, str], ref_id: str) -> Union[None, dict]:
@@ -857,12 +999,9 @@ async def get_manifest(db, ref_id: str) -> dict:
     :return: a manifest of otu ids and versions
 
     """
-    manifest = dict()
-
-    async for document in db.otus.find({"reference.id": ref_id}, ["version"]):
-        manifest[document["_id"]] = document["version"]
+    cursor = db.otus.find({"reference.id": ref_id}, ["version"]).batch_size(MANIFEST_BATCH_SIZE)
 
-    return manifest
+    return {document["_id"]: document["version"] for document in await cursor.to_list(None)}
 
 
 async def get_otu_count(db, ref_id: str) -> int:
@@ -1108,8 +1247,6 @@ async def edit(db, ref_id: str, data: dict) -> dict:
 async def export(app, ref_id):
     db = app["db"]
 
-    otu_list = list()
-
     query = {
         "reference.id": ref_id,
         "last_indexed_version": {
@@ -1117,14 +1254,11 @@ async def export(app, ref_id):
         }
     }
 
-    async for document in db.otus.find(query):
-        _, joined, _ = await virtool.history.db.patch_to_version(
-            app,
-            document["_id"],
-            document["last_indexed_version"]
-        )
+    cursor = db.otus.find(query, ["last_indexed_version"])
+
+    specifiers = [(document["_id"], document["last_indexed_version"]) async for document in cursor]
 
-        otu_list.append(joined)
+    otu_list = await patch_many_to_versions(app, specifiers)
 
     return virtool.references.utils.clean_export_list(otu_list)
 
@@ -1196,19 +1330,15 @@ async def finish_remote(app, release, ref_id: str, created_at: str, process_id:
         initial=0.4
     )
 
-    inserted_otu_ids = list()
-
-    for otu in otus:
-        otu_id = await insert_joined_otu(
-            db,
-            otu,
-            created_at,
-            ref_id,
-            user_id,
-            remote=True
-        )
-        inserted_otu_ids.append(otu_id)
-        await progress_tracker.add(1)
+    joined_otus = await insert_joined_otus(
+        db,
+        otus,
+        created_at,
+        ref_id,
+        user_id,
+        remote=True,
+        progress_handler=progress_tracker.add
+    )
 
     await virtool.processes.db.update(
         db,
@@ -1225,44 +1355,51 @@ async def finish_remote(app, release, ref_id: str, created_at: str, process_id:
         initial=0.7
     )
 
-    for otu_id in inserted_otu_ids:
-        await insert_change(
-            app,
-            otu_id,
-            "remote",
-            user_id
-        )
-
-        await progress_tracker.add(1)
+    await insert_changes(
+        app,
+        [joined["_id"] for joined in joined_otus],
+        "remote",
+        user_id,
+        joined_otus={joined["_id"]: joined for joined in joined_otus},
+        progress_handler=progress_tracker.add
+    )
 
+    # The installed release can't be newer than itself, so it is stored directly instead of fetching it again.
     await db.references.update_one({"_id": ref_id, "updates.id": release["id"]}, {
         "$set": {
             "installed": virtool.github.create_update_subdocument(release, True, user_id),
+            "release": dict(release, newer=False, retrieved_at=virtool.utils.timestamp()),
             "updates.$.ready": True,
             "updating": False
         }
     })
 
-    await fetch_and_update_release(app, ref_id)
-
     await virtool.processes.db.update(db, process_id, progress=1)
 
 
-async def insert_change(app, otu_id: str, verb: str, user_id: str, old: Union[None, dict] = None):
+async def prepare_change(
+        db,
+        otu_id: str,
+        verb: str,
+        user_id: str,
+        old: Union[None, dict] = None,
+        joined: Union[None, dict] = None
+) -> dict:
     """
-    Insert a history document for the OTU identified by `otu_id` and the passed `verb`.
+    Compose a history document for the OTU identified by `otu_id` and the passed `verb` without inserting it.
 
-    :param app: the application object
+    :param db: the application database client
     :param otu_id: the ID of the OTU the change is for
     :param verb: the change verb (eg. remove, insert)
     :param user_id: the ID of the requesting user
     :param old: the old joined OTU document
+    :param joined: the current joined OTU document, if it is already available
+    :return: the change document
 
     """
-    db = app["db"]
-
     # Join the otu document into a complete otu record. This will be used for recording history.
-    joined = await virtool.otus.db.join(db, otu_id)
+    if joined is None:
+        joined = await virtool.otus.db.join(db, otu_id)
 
     name = joined["name"]
 
@@ -1277,18 +1414,63 @@ async def insert_change(app, otu_id: str, verb: str, user_id: str, old: Union[No
     if abbreviation:
         description = f"{description} ({abbreviation})"
 
-    await virtool.history.db.add(
-        app,
+    return virtool.history.db.compose_document(
         verb,
         old,
         joined,
         description,
-        user_id,
-        silent=True
+        user_id
     )
 
 
-async def insert_joined_otu(db, otu, created_at, ref_id, user_id, remote=False):
+async def insert_changes(
+        app,
+        otu_ids: List[str],
+        verb: str,
+        user_id: str,
+        joined_otus: Union[None, dict] = None,
+        progress_handler: Union[None, Callable] = None
+):
+    """
+    Insert history documents for the OTUs identified by `otu_ids` and the passed `verb`. The documents are composed
+    with :func:`prepare_change` and inserted in batches of :data:`HISTORY_INSERT_CHUNK_SIZE`.
+
+    :param app: the application object
+    :param otu_ids: the IDs of the OTUs the changes are for
+    :param verb: the change verb (eg. remove, insert)
+    :param user_id: the ID of the requesting user
+    :param joined_otus: current joined OTU documents keyed by OTU ID, if they are already available
+    :param progress_handler: a coroutine function called with the number of changes inserted in each batch
+
+    """
+    joined_otus = joined_otus or dict()
+
+    for index in range(0, len(otu_ids), HISTORY_INSERT_CHUNK_SIZE):
+        chunk = otu_ids[index:index + HISTORY_INSERT_CHUNK_SIZE]
+
+        documents = [
+            await prepare_change(app["db"], otu_id, verb, user_id, joined=joined_otus.get(otu_id)) for otu_id in chunk
+        ]
+
+        await virtool.history.db.add_many(app, documents)
+
+        if progress_handler:
+            await progress_handler(len(chunk))
+
+
+def prepare_joined_otu(otu: dict, created_at, ref_id: str, user_id: str, remote: bool = False) -> Tuple[dict, list]:
+    """
+    Prepare a joined OTU from a reference file for insertion. Returns the OTU document and a list of its sequence
+    documents. The `otu_id` field is not set on the sequences because the OTU id is not known until it is inserted.
+
+    :param otu: the joined OTU
+    :param created_at: the creation timestamp to assign to the OTU
+    :param ref_id: the id of the reference the OTU is being added to
+    :param user_id: the id of the user adding the OTU
+    :param remote: the OTU is from a remote reference
+    :return: the OTU document and its sequences
+
+    """
     all_sequences = list()
 
     issues = virtool.otus.utils.verify(otu)
@@ -1340,28 +1522,124 @@ async def insert_joined_otu(db, otu, created_at, ref_id, user_id, remote=False):
                 }
             })
 
+    return otu, all_sequences
+
+
+async def insert_joined_otu(db, otu, created_at, ref_id, user_id, remote=False):
+    otu, all_sequences = prepare_joined_otu(otu, created_at, ref_id, user_id, remote=remote)
+
     document = await db.otus.insert_one(otu, silent=True)
 
     for sequence in all_sequences:
-        await db.sequences.insert_one(dict(sequence, otu_id=document["_id"]), silent=True)
+        sequence["otu_id"] = document["_id"]
+
+    await virtool.db.utils.insert_many_with_ids(db.sequences, all_sequences)
 
     return document["_id"]
 
 
+async def insert_joined_otus(
+        db,
+        otus: List[dict],
+        created_at,
+        ref_id: str,
+        user_id: str,
+        remote: bool = False,
+        progress_handler: Union[callable, None] = None
+) -> List[str]:
+    """
+    Insert many joined OTUs. OTUs and their sequences are inserted in chunks of :data:`OTU_INSERT_CHUNK_SIZE` with one
+    `insert_many` call for the OTUs and one for the sequences in each chunk.
+
+    :param db: the application database client
+    :param otus: the joined OTUs to insert
+    :param created_at: the creation timestamp to assign to the OTUs
+    :param ref_id: the id of the reference the OTUs are being added to
+    :param user_id: the id of the user adding the OTUs
+    :param remote: the OTUs are from a remote reference
+    :param progress_handler: a coroutine function called with the number of OTUs inserted after each chunk
+    :return: the inserted OTUs joined with their sequences, in the same order as `otus`
+
+    """
+    joined_otus = list()
+
+    for i in range(0, len(otus), OTU_INSERT_CHUNK_SIZE):
+        chunk = otus[i:i + OTU_INSERT_CHUNK_SIZE]
+
+        prepared = [prepare_joined_otu(otu, created_at, ref_id, user_id, remote=remote) for otu in chunk]
+
+        otu_documents = await virtool.db.utils.insert_many_with_ids(db.otus, [otu for otu, _ in prepared])
+
+        all_sequences = list()
+
+        for otu_document, (_, sequences) in zip(otu_documents, prepared):
+            for sequence in sequences:
+                sequence["otu_id"] = otu_document["_id"]
+
+            all_sequences += sequences
+
+        await virtool.db.utils.insert_many_with_ids(db.sequences, all_sequences)
+
+        joined_otus += [
+            virtool.otus.utils.merge_otu(otu_document, sequences)
+            for otu_document, (_, sequences) in zip(otu_documents, prepared)
+        ]
+
+        if progress_handler:
+            await progress_handler(len(chunk))
+
+    return joined_otus
+
+
+async def patch_many_to_versions(app, specifiers: List[Tuple[str, int]]) -> List[dict]:
+    """
+    Patch many OTUs to the given versions concurrently. At most :data:`PATCH_CONCURRENCY` OTUs are patched at
+    once.
+
+    :param app: the application object
+    :param specifiers: pairs of OTU ids and the versions to patch them to
+    :return: the patched OTUs in the same order as `specifiers`
+
+    """
+    semaphore = asyncio.Semaphore(PATCH_CONCURRENCY)
+
+    async def patch(otu_id, version):
+        async with semaphore:
+            _, patched, _ = await virtool.history.db.patch_to_version(app, otu_id, version)
+            return patched
+
+    return await asyncio.gather(*[patch(otu_id, version) for otu_id, version in specifiers])
+
+
 async def refresh_remotes(app):
     db = app["db"]
 
     try:
         logging.debug("Started reference refresher")
 
-        while True:
-            for ref_id in await db.references.distinct("_id", {"remotes_from": {"$exists": True}}):
-                await fetch_and_update_release(
+        semaphore = asyncio.Semaphore(REFRESH_CONCURRENCY)
+
+        async def refresh(ref_id):
+            async with semaphore:
+                return await fetch_and_update_release(
                     app,
                     ref_id,
                     ignore_errors=True
                 )
 
+        while True:
+            ref_ids = await db.references.distinct("_id", {"remotes_from": {"$exists": True}})
+
+            # Refresh remotes concurrently. A failure for one remote does not prevent refreshing the others.
+            results = await asyncio.gather(*[refresh(ref_id) for ref_id in ref_ids], return_exceptions=True)
+
+            for ref_id, result in zip(ref_ids, results):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+
+                if isinstance(result, Exception):
+                    logging.warning(f"Could not refresh remote reference {ref_id}: {result}")
+
             await asyncio.sleep(600)
     except asyncio.CancelledError:
         pass
@@ -1427,28 +1705,25 @@ async def update_joined_otu(db, otu, created_at, ref_id, user_id):
                     }
                 })
 
+        update = {
+            "abbreviation": otu["abbreviation"],
+            "name": otu["name"],
+            "isolates": otu["isolates"],
+            "schema": otu.get("schema", list())
+        }
+
+        # The stored `lower_name` is still correct if the name didn't change.
+        if otu["name"] != old["name"]:
+            update["lower_name"] = otu["name"].lower()
+
         await db.otus.update_one({"_id": old["_id"]}, {
             "$inc": {
                 "version": 1
             },
-            "$set": {
-                "abbreviation": otu["abbreviation"],
-                "name": otu["name"],
-                "lower_name": otu["name"].lower(),
-                "isolates": otu["isolates"],
-                "schema": otu.get("schema", list())
-            }
+            "$set": update
         })
 
-        for sequence_update in sequence_updates:
-            remote_sequence_id = sequence_update["remote"]["id"]
-
-            update_result = await db.sequences.update_one({"reference.id": ref_id, "remote.id": remote_sequence_id}, {
-                "$set": sequence_update
-            })
-
-            if not update_result.matched_count:
-                await db.sequences.insert_one(sequence_update)
+        await upsert_remote_sequences(db, ref_id, sequence_updates)
 
         return old
 
@@ -1460,3 +1735,38 @@ async def update_joined_otu(db, otu, created_at, ref_id, user_id):
         user_id,
         remote=True
     )
+
+
+async def upsert_remote_sequences(db, ref_id: str, sequence_updates: List[dict]):
+    """
+    Update or insert sequences from a remote reference update using a single unordered `bulk_write` call. Sequences
+    are matched using their remote ids. New sequences are given random alphanumeric ids, and upserts that fail
+    because of a duplicate generated id are retried.
+
+    :param db: the application database client
+    :param ref_id: the id of the reference being updated
+    :param sequence_updates: the sequence documents to write
+
+    """
+    pending = sequence_updates
+
+    while pending:
+        operations = [
+            pymongo.UpdateOne({"reference.id": ref_id, "remote.id": sequence_update["remote"]["id"]}, {
+                "$set": sequence_update,
+                "$setOnInsert": {
+                    "_id": virtool.utils.random_alphanumeric(8)
+                }
+            }, upsert=True) for sequence_update in pending
+        ]
+
+        try:
+            await db.sequences.bulk_write(operations, ordered=False)
+            break
+        except pymongo.errors.BulkWriteError as err:
+            write_errors = err.details["writeErrors"]
+
+            if any(e["code"] != virtool.db.utils.DUPLICATE_KEY_ERROR_CODE for e in write_errors):
+                raise
+
+            pending = [pending[e["index"]] for e in write_errors]
@@ -1,6 +1,8 @@
+import functools
 import gzip
 import json
 
+import semver
 from cerberus import Validator
 from operator import itemgetter
 
@@ -409,9 +411,23 @@ def load_reference_file(path):
     :rtype: dict
 
     """
+    # Decompress the whole file and decode it once instead of reading through a text wrapper.
     with open(path, "rb") as handle:
-        with gzip.open(handle, "rt") as gzip_file:
-            return json.load(gzip_file)
+        with gzip.GzipFile(fileobj=handle) as gzip_file:
+            return json.loads(gzip_file.read())
+
+
+@functools.lru_cache(maxsize=256)
+def parse_release_version(name: str) -> semver.VersionInfo:
+    """
+    Parse a release name like `v1.2.3` into a comparable semantic version. Results are cached because the same release
+    names are compared every time remote references are refreshed.
+
+    :param name: the release name
+    :return: the parsed version
+
+    """
+    return semver.VersionInfo.parse(name.lstrip("v"))
 
 
 def validate_otu(otu, strict):
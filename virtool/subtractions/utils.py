@@ -1,30 +1,51 @@
 import logging
+import mmap
 import os
+import re
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+#: The number of bytes of a FASTA file to count nucleotides in at once in :func:`calculate_fasta_gc`.
+GC_BUFFER_SIZE = 1024 * 1024
+
+#: Matches FASTA header lines.
+FASTA_HEADER_RE = re.compile(rb"^>[^\n]*", re.MULTILINE)
+
 
 def calculate_fasta_gc(path):
-    nucleotides = {
-        "a": 0,
-        "t": 0,
-        "g": 0,
-        "c": 0,
-        "n": 0
-    }
+    """
+    Calculate the nucleotide composition and the number of sequences in the FASTA file at `path`.
+
+    The file is memory-mapped and byte frequencies are counted with :func:`numpy.bincount` in slices of
+    :data:`GC_BUFFER_SIZE` bytes. Bytes in header lines are counted separately and subtracted.
+
+    :param path: the path to the FASTA file
+    :return: the proportion of each nucleotide and the number of sequences
+
+    """
+    counts = np.zeros(256, dtype=np.int64)
 
     count = 0
 
     # Go through the fasta file getting the nucleotide counts, lengths, and number of sequences
-    with open(path, "r") as handle:
-        for line in handle:
-            if line[0] == ">":
-                count += 1
-                continue
-
-            for i in ["a", "t", "g", "c", "n"]:
-                # Find lowercase and uppercase nucleotide characters
-                nucleotides[i] += line.lower().count(i)
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                data = np.frombuffer(mapped, dtype=np.uint8)
+
+                for offset in range(0, len(data), GC_BUFFER_SIZE):
+                    counts += np.bincount(data[offset:offset + GC_BUFFER_SIZE], minlength=256)
+
+                for match in FASTA_HEADER_RE.finditer(mapped):
+                    count += 1
+                    counts -= np.bincount(np.frombuffer(match.group(), dtype=np.uint8), minlength=256)
+
+                del data
+
+    # Find lowercase and uppercase nucleotide characters
+    nucleotides = {i: int(counts[ord(i)] + counts[ord(i.upper())]) for i in ["a", "t", "g", "c", "n"]}
 
     nucleotides_sum = sum(nucleotides.values())
 
@@ -7,7 +7,7 @@ import subprocess
 import sys
 import tarfile
 import tempfile
-from random import choice
+from random import choices
 from string import ascii_letters, ascii_lowercase, digits
 from typing import Iterable, Union
 
@@ -243,7 +243,7 @@ def random_alphanumeric(length: int = 6, mixed_case: bool = False, excluded: Uni
 
     characters = digits + (ascii_letters if mixed_case else ascii_lowercase)
 
-    candidate = "".join([choice(characters) for _ in range(length)])
+    candidate = "".join(choices(characters, k=length))
 
     if candidate not in excluded:
         return candidate